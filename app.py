@@ -1,14 +1,17 @@
+import hashlib
 import os
 import re
-import tempfile
+import threading
 from calendar import monthrange
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 
 import streamlit as st
 
-from attendance_generator import generate_attendance
-from attendance_parser import parse_language_records
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template.xlsx")
+MAX_VALIDATION_MESSAGES = 200
 
 
 def _is_valid_teacher_option(value):
@@ -28,15 +31,83 @@ def _is_valid_teacher_option(value):
     return True
 
 
-def load_teacher_options(workbook_path):
+def teacher_options_from_records(records):
     teacher_names = {
         record["강사"]
-        for record in parse_language_records(workbook_path)
+        for record in records
         if record.get("강사")
     }
     return sorted(teacher for teacher in teacher_names if _is_valid_teacher_option(teacher))
 
 
+def load_teacher_options(workbook_path):
+    from attendance_parser import parse_language_records
+
+    return teacher_options_from_records(parse_language_records(workbook_path))
+
+
+def load_records(workbook_bytes):
+    from attendance_parser import iter_language_record_batches
+    from attendance_profiling import profile_section
+
+    upload_key = hashlib.sha256(workbook_bytes).hexdigest()
+    cached = st.session_state.get("parsed_upload")
+    if cached and cached[0] == upload_key:
+        return cached[1]
+
+    sheet_cache = get_sheet_cache()
+    records = []
+    progress = st.empty()
+    with profile_section("parse"):
+        for sheet_name, sheet_records in iter_language_record_batches(workbook_bytes, sheet_cache=sheet_cache):
+            records.extend(sheet_records)
+            teachers = teacher_options_from_records(records)
+            progress.caption(f"{sheet_name} 시트 완료 · 강사 {len(teachers)}명: {', '.join(teachers)}")
+    progress.empty()
+
+    st.session_state["parsed_upload"] = (upload_key, records)
+    return records
+
+
+@st.cache_resource(show_spinner=False)
+def get_sheet_cache():
+    from attendance_sheet_cache import SheetRecordCache
+
+    return SheetRecordCache(max_entries=int(os.environ.get("ATTENDANCE_SHEET_CACHE_ENTRIES", "64")))
+
+
+@st.cache_resource(show_spinner=False)
+def get_output_cache():
+    from attendance_output_cache import OutputCache
+
+    return OutputCache(
+        max_bytes=int(os.environ.get("ATTENDANCE_OUTPUT_CACHE_MB", "64")) * 1024 * 1024,
+        disk_dir=os.environ.get("ATTENDANCE_OUTPUT_CACHE_DIR") or None,
+    )
+
+
+def _warm_up(year):
+    import pandas as pd
+
+    import attendance_parser  # noqa: F401
+    from attendance_generator import compile_template, korean_holiday_dates, load_template_bytes
+
+    korean_holiday_dates(year)
+    if Path(TEMPLATE_PATH).exists():
+        template_bytes = load_template_bytes(TEMPLATE_PATH)
+        # Parse the template and locate its anchors once per process for generate_attendance.
+        compile_template(template_bytes)
+        # pandas imports its Excel reader on first use; trigger that before the first upload.
+        pd.read_excel(BytesIO(template_bytes), nrows=0, engine="openpyxl")
+
+
+@st.cache_resource(show_spinner=False)
+def start_warm_up(year):
+    thread = threading.Thread(target=_warm_up, args=(year,), name=f"warm-up-{year}", daemon=True)
+    thread.start()
+    return thread
+
+
 st.set_page_config(page_title="출석부 생성기", layout="centered")
 st.title("출석부 자동 생성기")
 st.markdown("업무용 시간표 엑셀 파일을 업로드하고 출석부를 생성하세요.")
@@ -77,50 +148,92 @@ with st.expander("사용자 지정 날짜 설정"):
     manual_holidays = parse_dates(manual_holiday_strs)
     manual_includes = parse_dates(manual_include_strs)
 
+start_warm_up(today.year)
+start_warm_up(selected_year)
+
 if uploaded_file:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp_input:
-        tmp_input.write(uploaded_file.getvalue())
-        tmp_input_path = tmp_input.name
-
-    try:
-        with st.spinner("강사 목록을 불러오는 중..."):
-            all_teachers = load_teacher_options(tmp_input_path)
-
-        if not all_teachers:
-            st.error("강사 목록을 찾지 못했습니다. 업로드한 파일 형식을 확인해주세요.")
-        else:
-            selected_teachers = st.multiselect(
-                "출석부를 생성할 강사를 선택하세요 (선택 없으면 전체 생성)",
-                all_teachers,
-                placeholder="선택하지 않으면 전체 강사 출석부를 생성합니다.",
+    from attendance_generator import load_template_bytes
+    from attendance_output_cache import generate_attendance_cached
+    from attendance_preview import build_preview, preview_to_html, preview_to_json
+    from attendance_profiling import profile_section
+    from attendance_validation import has_issues, report_messages, validate_records
+
+    workbook_bytes = uploaded_file.getvalue()
+
+    with st.spinner("강사 목록을 불러오는 중..."):
+        records = load_records(workbook_bytes)
+        all_teachers = teacher_options_from_records(records)
+
+    if not all_teachers:
+        st.error("강사 목록을 찾지 못했습니다. 업로드한 파일 형식을 확인해주세요.")
+    else:
+        validation_report = validate_records(records)
+        if has_issues(validation_report):
+            st.warning(
+                f"일정 점검: 강사 시간 중복 {len(validation_report['teacher_conflicts'])}건, "
+                f"학생 시간 중복 {len(validation_report['student_conflicts'])}건, "
+                f"학생 중복 등록 {len(validation_report['duplicate_students'])}건"
             )
-
+        messages = report_messages(validation_report)
+        if messages:
+            with st.expander(f"일정 점검 상세 ({len(messages)}건)"):
+                st.text("\n".join(messages[:MAX_VALIDATION_MESSAGES]))
+                if len(messages) > MAX_VALIDATION_MESSAGES:
+                    st.caption(f"외 {len(messages) - MAX_VALIDATION_MESSAGES}건")
+
+        selected_teachers = st.multiselect(
+            "출석부를 생성할 강사를 선택하세요 (선택 없으면 전체 생성)",
+            all_teachers,
+            placeholder="선택하지 않으면 전체 강사 출석부를 생성합니다.",
+        )
+
+        target_set = None if not selected_teachers else set(selected_teachers)
+        filtered_records = [
+            record for record in records
+            if target_set is None or record["강사"] in target_set
+        ]
+
+        preview_col, generate_col = st.columns(2)
+        with preview_col:
+            preview = st.button("미리보기")
+        with generate_col:
             generate = st.button("출석부 생성")
 
-            if generate:
-                with st.spinner("출석부 생성 중..."):
-                    records = parse_language_records(tmp_input_path)
-                    if not records:
-                        st.error("출석부를 만들 수 있는 수업 데이터를 찾지 못했습니다. 파일 형식을 확인해주세요.")
-                        st.stop()
-
-                    target_set = None if not selected_teachers else set(selected_teachers)
-                    filtered_records = [
-                        record for record in records
-                        if target_set is None or record["강사"] in target_set
-                    ]
-                    if not filtered_records:
-                        st.error("선택한 강사에 해당하는 수업 데이터가 없습니다.")
-                        st.stop()
-
-                    base_dir = os.path.dirname(os.path.abspath(__file__))
-                    template_path = os.path.join(base_dir, "template.xlsx")
-                    if not Path(template_path).exists():
-                        raise FileNotFoundError(f"template.xlsx not found at {template_path}")
-
-                    output_stream = generate_attendance(
+        if preview:
+            if not filtered_records:
+                st.error("선택한 강사에 해당하는 수업 데이터가 없습니다.")
+                st.stop()
+
+            preview_data = build_preview(
+                filtered_records,
+                year=selected_year,
+                month=selected_month,
+                day_type=selected_day_type,
+                manual_holidays=manual_holidays,
+                manual_includes=manual_includes,
+            )
+            st.html(preview_to_html(preview_data))
+            with st.expander("미리보기 JSON"):
+                st.code(preview_to_json(preview_data), language="json")
+
+        if generate:
+            with st.spinner("출석부 생성 중..."):
+                if not records:
+                    st.error("출석부를 만들 수 있는 수업 데이터를 찾지 못했습니다. 파일 형식을 확인해주세요.")
+                    st.stop()
+
+                if not filtered_records:
+                    st.error("선택한 강사에 해당하는 수업 데이터가 없습니다.")
+                    st.stop()
+
+                if not Path(TEMPLATE_PATH).exists():
+                    raise FileNotFoundError(f"template.xlsx not found at {TEMPLATE_PATH}")
+
+                with profile_section("generate"):
+                    output_stream = generate_attendance_cached(
+                        get_output_cache(),
                         filtered_records,
-                        template_path=template_path,
+                        template_path=load_template_bytes(TEMPLATE_PATH),
                         year=selected_year,
                         month=selected_month,
                         day_type=selected_day_type,
@@ -128,16 +241,11 @@ if uploaded_file:
                         manual_includes=manual_includes,
                     )
 
-                filename = f"{selected_year}년_{selected_month:02d}월_출석부.xlsx"
-                st.success("출석부 생성이 완료되었습니다.")
-                st.download_button(
-                    "출석부 다운로드",
-                    data=output_stream.getvalue(),
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                )
-    finally:
-        try:
-            os.unlink(tmp_input_path)
-        except OSError:
-            pass
+            filename = f"{selected_year}년_{selected_month:02d}월_출석부.xlsx"
+            st.success("출석부 생성이 완료되었습니다.")
+            st.download_button(
+                "출석부 다운로드",
+                data=output_stream.getvalue(),
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
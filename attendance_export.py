@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""수업 기록을 출석 날짜와 함께 CSV, JSON Lines, Parquet 파일로 내보내는 스크립트."""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import date
+from itertools import islice
+
+from attendance_generator import (
+    format_day_display,
+    month_attendance_days,
+    preprocess_duration,
+    record_class_name,
+    record_teacher,
+    resolve_year_month,
+    valid_dates_for_record,
+)
+
+
+EXPORT_COLUMNS = ["teacher", "class", "day", "time", "dates", "student", "duration"]
+PARQUET_BATCH_ROWS = 10000
+
+
+def iter_export_rows(
+    records,
+    year=None,
+    month=None,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    """Yield one flat row per enrolled student, in record order, without building the workbook.
+
+    Teachers and students are filtered exactly as generate_attendance does, and
+    ``dates`` holds the class's attendance dates for the month.
+    """
+    used_year, used_month = resolve_year_month(year, month)
+    month_days = month_attendance_days(used_year, used_month, manual_holidays, manual_includes)
+
+    for record in records:
+        teacher = record_teacher(record)
+        if teacher is None:
+            continue
+        class_name = record_class_name(record)
+        day_text = format_day_display(record.get("요일", ""))
+        time_text = record.get("시간", "")
+        dates = [
+            date(used_year, used_month, day_num)
+            for _, day_num in valid_dates_for_record(record, month_days, day_type)
+        ]
+        for student in record.get("학생목록", []):
+            if not student.get("name"):
+                continue
+            yield {
+                "teacher": teacher,
+                "class": class_name,
+                "day": day_text,
+                "time": time_text,
+                "dates": dates,
+                "student": student["name"],
+                "duration": preprocess_duration(student.get("duration")),
+            }
+
+
+def write_csv(rows, stream):
+    writer = csv.writer(stream)
+    writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow([
+            ";".join(value.isoformat() for value in row["dates"]) if column == "dates" else row[column]
+            for column in EXPORT_COLUMNS
+        ])
+        count += 1
+    return count
+
+
+def write_jsonl(rows, stream):
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(
+            {**row, "dates": [value.isoformat() for value in row["dates"]]},
+            ensure_ascii=False,
+        ))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet export requires pyarrow. Install it with `pip install pyarrow` "
+            "or export as csv/jsonl instead."
+        ) from exc
+    return pa, pq
+
+
+def write_parquet(rows, stream, batch_rows=PARQUET_BATCH_ROWS):
+    pa, pq = _import_pyarrow()
+
+    schema = pa.schema([
+        ("teacher", pa.string()),
+        ("class", pa.string()),
+        ("day", pa.string()),
+        ("time", pa.string()),
+        ("dates", pa.list_(pa.date32())),
+        ("student", pa.string()),
+        ("duration", pa.string()),
+    ])
+    count = 0
+    rows = iter(rows)
+    with pq.ParquetWriter(stream, schema) as writer:
+        while True:
+            batch = list(islice(rows, batch_rows))
+            if not batch:
+                break
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+EXPORT_FORMATS = {
+    "csv": (write_csv, "text"),
+    "jsonl": (write_jsonl, "text"),
+    "parquet": (write_parquet, "binary"),
+}
+
+
+def format_from_path(path):
+    extension = os.path.splitext(str(path))[1].lower().lstrip(".")
+    if extension in ("json", "ndjson"):
+        return "jsonl"
+    return extension if extension in EXPORT_FORMATS else None
+
+
+def export_records(
+    records,
+    output,
+    fmt=None,
+    year=None,
+    month=None,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    """Stream records to ``output`` (a path or an open stream); return the number of rows written."""
+    fmt = fmt or format_from_path(output)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt!r} (choose from {', '.join(EXPORT_FORMATS)})")
+    writer, mode = EXPORT_FORMATS[fmt]
+
+    if fmt == "parquet":
+        _import_pyarrow()
+
+    rows = iter_export_rows(records, year, month, day_type, manual_holidays, manual_includes)
+    if hasattr(output, "write"):
+        return writer(rows, output)
+    if mode == "binary":
+        with open(output, "wb") as output_file:
+            return writer(rows, output_file)
+    with open(output, "w", encoding="utf-8", newline="") as output_file:
+        return writer(rows, output_file)
+
+
+def main(argv=None):
+    from attendance_parser import iter_language_records
+
+    parser = argparse.ArgumentParser(description="수업 기록을 CSV/JSONL/Parquet으로 내보내기")
+    parser.add_argument("workbooks", nargs="+", help="시간표 엑셀 파일 (여러 지점 가능)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 경로")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), help="출력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--month", type=int)
+    parser.add_argument("--day-type", default="주중", choices=["주중", "토요일"])
+    parser.add_argument("--engine", default="xml", choices=["openpyxl", "xml"])
+    args = parser.parse_args(argv)
+
+    fmt = args.format or format_from_path(args.output)
+    if fmt is None:
+        parser.error("출력 형식을 알 수 없습니다. --format 을 지정하세요.")
+
+    def records():
+        for workbook in args.workbooks:
+            yield from iter_language_records(workbook, engine=args.engine)
+
+    try:
+        count = export_records(records(), args.output, fmt, args.year, args.month, args.day_type)
+    except ImportError as exc:
+        print(f"오류: {exc}")
+        return 1
+    print(f"내보내기 완료: {count}행 → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import random
+from io import BytesIO
+
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+
+from attendance_parser import SHEET_CONFIGS
+
+
+_SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권"]
+_GIVEN_NAMES = ["민수", "지은", "서준", "유리", "하늘", "다은", "서연", "지민", "세훈", "지수", "현우", "예린"]
+_TEACHERS = ["Ray", "John", "Sarah", "Emma", "김선생", "이선생", "박선생", "정선생"]
+_DAYS = ["월수", "화목", "월수금", "토", "월~금"]
+
+
+def build_timetable_bytes(classes_per_sheet=40, seed=0, memo_columns=0, gap_rows=False, note_after=None):
+    """Build a synthetic timetable workbook laid out like SHEET_CONFIGS.
+
+    ``memo_columns`` adds memo/price columns the parser does not read,
+    ``gap_rows`` leaves an empty row after every class, and ``note_after``
+    puts a ``※`` note in an unread column after that many classes.
+    """
+    rnd = random.Random(seed)
+    wb = Workbook()
+    wb.remove(wb.active)
+    for sheet_name, header_row, _, preferred_course_col in SHEET_CONFIGS:
+        ws = wb.create_sheet(sheet_name)
+        ws.cell(row=1, column=1, value=f"{sheet_name} 시간표")
+
+        course_label = preferred_course_col.split(".")[0]
+        headers = ["No", "강사", "구분1", course_label, "요일", "시간"]
+        if preferred_course_col.endswith(".1"):
+            headers.append(course_label)
+        memo_start = len(headers) + 1
+        headers += [f"메모{idx + 1}" if idx % 2 == 0 else f"수강료{idx + 1}" for idx in range(memo_columns)]
+        student_start = len(headers) + 1
+        headers += list(range(1, 21))
+        for col, header in enumerate(headers, 1):
+            ws.cell(row=header_row, column=col, value=header)
+        course_col = max(idx for idx, header in enumerate(headers, 1) if header == course_label)
+
+        row = header_row + 1
+        for class_idx in range(classes_per_sheet):
+            if note_after is not None and class_idx == note_after:
+                ws.cell(row=row, column=3, value="※ 다음 달 시간표 변경 예정")
+                row += 1
+            start_hour = rnd.randint(9, 20)
+            ws.cell(row=row, column=1, value=class_idx + 1)
+            ws.cell(row=row, column=2, value=rnd.choice(_TEACHERS))
+            ws.cell(row=row, column=5, value=rnd.choice(_DAYS))
+            ws.cell(row=row, column=6, value=f"{start_hour}:00-{start_hour + 1}:30")
+            ws.cell(row=row, column=course_col, value=f"{sheet_name} {class_idx + 1}반")
+            for memo_idx in range(memo_columns):
+                ws.cell(
+                    row=row,
+                    column=memo_start + memo_idx,
+                    value=f"상담 {rnd.randint(1, 99)}" if memo_idx % 2 == 0 else rnd.randint(10, 40) * 10000,
+                )
+            for student_idx in range(rnd.randint(1, 12)):
+                cell = ws.cell(
+                    row=row,
+                    column=student_start + student_idx,
+                    value=rnd.choice(_SURNAMES) + rnd.choice(_GIVEN_NAMES),
+                )
+                if rnd.random() < 0.3:
+                    cell.comment = Comment(f"등록\n{rnd.randint(1, 6)}/1-{rnd.randint(7, 12)}/30", "fixture")
+            row += 2 if gap_rows else 1
+        ws.cell(row=row + 1, column=2, value="합계")
+
+    output = BytesIO()
+    wb.save(output)
+    return output.getvalue()
@@ -1,10 +1,11 @@
 import calendar
 import re
+import zipfile
 from copy import copy
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from io import BytesIO
 
-import holidays
 from openpyxl import load_workbook
 from openpyxl.cell.rich_text import CellRichText, TextBlock
 from openpyxl.cell.text import InlineFont
@@ -13,6 +14,37 @@ from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.pagebreak import Break, RowBreak
 
 
+# Bump whenever a change alters the generated workbook for the same inputs.
+GENERATOR_VERSION = "1"
+
+_DURATION_FONT = Font(size=8)
+
+
+def as_workbook_source(source):
+    """Return a path string or a rewound binary stream that openpyxl and pandas can read."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BytesIO(bytes(source))
+    if hasattr(source, "read"):
+        source.seek(0)
+        return source
+    return str(source)
+
+
+def read_workbook_bytes(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        source.seek(0)
+        return source.read()
+    with open(source, "rb") as workbook_file:
+        return workbook_file.read()
+
+
+@lru_cache(maxsize=8)
+def load_template_bytes(template_path):
+    return read_workbook_bytes(template_path)
+
+
 def convert_non_string_to_string(value):
     return str(value) if not isinstance(value, str) else value
 
@@ -131,7 +163,32 @@ def format_day_display(yoil_str):
     return "".join(chars) if chars else str(yoil_str)
 
 
-def shrink_font_to_fit(cell, max_chars, min_size=6.0):
+class StyleCache:
+    """Share one font object per (base font, size) across a generated workbook."""
+
+    def __init__(self):
+        self._fonts = {}
+        self._inline_fonts = {}
+
+    def resized_font(self, cell, size):
+        key = (cell._style.fontId, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = copy(cell.font) if cell.font else Font()
+            font.size = size
+            self._fonts[key] = font
+        return font
+
+    def inline_font(self, cell, size):
+        key = (cell._style.fontId, size)
+        font = self._inline_fonts.get(key)
+        if font is None:
+            font = _build_inline_font_from_cell(cell, size)
+            self._inline_fonts[key] = font
+        return font
+
+
+def shrink_font_to_fit(cell, max_chars, min_size=6.0, style_cache=None):
     if not cell.value or not isinstance(cell.value, str):
         return
     text_len = len(cell.value)
@@ -139,15 +196,38 @@ def shrink_font_to_fit(cell, max_chars, min_size=6.0):
         return
     current_size = (cell.font.size or 11) if cell.font else 11
     new_size = max(min_size, round(current_size * max_chars / text_len, 1))
+    if style_cache is not None:
+        cell.font = style_cache.resized_font(cell, new_size)
+        return
     new_font = copy(cell.font) if cell.font else Font()
     new_font.size = new_size
     cell.font = new_font
 
 
+def style_table_size(source):
+    """Count the entries of each style table in a saved workbook's styles.xml."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    with zipfile.ZipFile(source) as archive:
+        styles_xml = archive.read("xl/styles.xml").decode("utf-8")
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+    sizes = {}
+    for tag in ("numFmts", "fonts", "fills", "borders", "cellStyleXfs", "cellXfs", "cellStyles", "dxfs"):
+        match = re.search(rf"<(?:\w+:)?{tag}\b[^>]*?\bcount=\"(\d+)\"", styles_xml)
+        sizes[tag] = int(match.group(1)) if match else 0
+    sizes["bytes"] = len(styles_xml.encode("utf-8"))
+    return sizes
+
+
 def _copy_cell(src_cell, dst_cell, copy_value=True):
     dst_cell.value = src_cell.value if copy_value else None
 
     if src_cell.has_style:
+        if src_cell.parent.parent is dst_cell.parent.parent:
+            dst_cell._style = copy(src_cell._style)
+            return
         dst_cell.font = copy(src_cell.font)
         dst_cell.border = copy(src_cell.border)
         dst_cell.fill = copy(src_cell.fill)
@@ -277,7 +357,7 @@ def _build_inline_font_from_cell(cell, size):
     )
 
 
-def set_class_text(cell, template_value, class_name):
+def set_class_text(cell, template_value, class_name, style_cache=None):
     prefix = str(template_value or "")
     if prefix.endswith("ABC"):
         prefix = prefix[:-3]
@@ -293,27 +373,113 @@ def set_class_text(cell, template_value, class_name):
     if len(class_name) > suffix_max_chars:
         suffix_size = max(6.0, round(base_size * suffix_max_chars / len(class_name), 1))
 
-    prefix_font = _build_inline_font_from_cell(cell, base_size)
-    class_font = _build_inline_font_from_cell(cell, suffix_size)
+    if style_cache is not None:
+        prefix_font = style_cache.inline_font(cell, base_size)
+        class_font = style_cache.inline_font(cell, suffix_size)
+    else:
+        prefix_font = _build_inline_font_from_cell(cell, base_size)
+        class_font = _build_inline_font_from_cell(cell, suffix_size)
     cell.value = CellRichText(
         TextBlock(prefix_font, prefix),
         TextBlock(class_font, class_name),
     )
 
 
-def generate_attendance(
-    records,
-    template_path,
-    year=None,
-    month=None,
-    day_type="주중",
-    manual_holidays=None,
-    manual_includes=None,
-):
-    manual_holidays = set(manual_holidays or [])
-    manual_includes = set(manual_includes or [])
+@lru_cache(maxsize=None)
+def korean_holiday_dates(year):
+    import holidays
+
+    return frozenset(holidays.KR(years=year))
+
+
+def as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+DAYS_KOR = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def resolve_year_month(year=None, month=None):
+    today = datetime.today()
+    return year or today.year, month or today.month
+
+
+def month_attendance_days(year, month, manual_holidays=None, manual_includes=None):
+    _, last_day = calendar.monthrange(year, month)
+    holiday_dates = (
+        korean_holiday_dates(year) | {as_date(value) for value in manual_holidays or []}
+    ) - {as_date(value) for value in manual_includes or []}
+
+    month_days = []
+    for day in range(1, last_day + 1):
+        date_obj = datetime(year, month, day)
+        if date_obj.date() not in holiday_dates:
+            month_days.append((date_obj.weekday(), date_obj.day))
+    return month_days
+
+
+def valid_dates_for_record(record, month_days, day_type="주중"):
+    yoil = record.get("요일", "")
+    indices = parse_weekday_indices(yoil)
+    if indices:
+        return [(DAYS_KOR[weekday], day_num) for weekday, day_num in month_days if weekday in indices]
+    if day_type == "토요일":
+        return [(DAYS_KOR[weekday], day_num) for weekday, day_num in month_days if weekday == 5]
+    return [(DAYS_KOR[weekday], day_num) for weekday, day_num in month_days if weekday < 5]
 
-    workbook = load_workbook(str(template_path), data_only=False, keep_links=False, keep_vba=False)
+
+def record_teacher(record):
+    teacher = record.get("강사")
+    if not isinstance(teacher, str):
+        return None
+    teacher = teacher.strip()
+    if not teacher or teacher.lower() == "nan" or teacher == "강사":
+        return None
+    return teacher
+
+
+def group_records_by_teacher(records):
+    teacher_to_records = {}
+    for record in records:
+        teacher = record_teacher(record)
+        if teacher is None:
+            continue
+        teacher_to_records.setdefault(teacher, []).append(record)
+    return teacher_to_records
+
+
+def record_class_name(record):
+    course = record.get("과정", "")
+    class_name = course.split("/")[0] if isinstance(course, str) and course.strip() else ""
+    return polish_class_name(class_name)
+
+
+def record_schedule_text(record):
+    return f"{format_day_display(record.get('요일', ''))} {record.get('시간', '')}"
+
+
+def _load_template_workbook(template_bytes):
+    return load_workbook(
+        BytesIO(template_bytes),
+        data_only=False,
+        keep_links=False,
+        keep_vba=False,
+    )
+
+
+@lru_cache(maxsize=8)
+def compile_template(template_bytes):
+    """Locate the template's anchor cells and dimensions once per template.
+
+    generate_attendance still loads a fresh workbook per call because it edits
+    it in place, and openpyxl workbooks do not survive pickle or deepcopy
+    intact (row dimensions lose their defaults).
+    """
+    workbook = _load_template_workbook(template_bytes)
     template_ws = workbook.worksheets[0]
     template_rows = template_ws.max_row
     template_cols = template_ws.max_column
@@ -338,49 +504,50 @@ def generate_attendance(
         raise ValueError("Template does not contain a 'Korean' header cell.")
 
     student_start_rel_row = korean_rel[0] + 2
-    student_last_rel_row = student_start_rel_row + student_slots - 1
-    student_name_alignment = copy(
-        template_ws.cell(row=student_start_rel_row, column=korean_rel[1]).alignment
-    )
+    return {
+        "rows": template_rows,
+        "cols": template_cols,
+        "student_slots": student_slots,
+        "class_rel": class_rel,
+        "class_template_value": class_template_value,
+        "teacher_rel": teacher_rel,
+        "korean_rel": korean_rel,
+        "student_start_rel_row": student_start_rel_row,
+        "student_last_rel_row": student_start_rel_row + student_slots - 1,
+        "student_name_alignment": copy(
+            template_ws.cell(row=student_start_rel_row, column=korean_rel[1]).alignment
+        ),
+    }
 
-    today = datetime.today()
-    used_year = year or today.year
-    used_month = month or today.month
-
-    days_kor = ["월", "화", "수", "목", "금", "토", "일"]
-    _, last_day = calendar.monthrange(used_year, used_month)
-
-    kr_holidays = holidays.KR(years=used_year)
-    for holiday_date in manual_holidays:
-        kr_holidays[holiday_date] = "사용자 지정 공휴일"
-    for include_date in manual_includes:
-        if include_date in kr_holidays:
-            del kr_holidays[include_date]
-
-    all_month_days = []
-    for day in range(1, last_day + 1):
-        date_obj = datetime(used_year, used_month, day)
-        if date_obj.date() not in kr_holidays:
-            all_month_days.append((date_obj.weekday(), date_obj.day))
-
-    def get_valid_dates_for_record(record):
-        yoil = record.get("요일", "")
-        indices = parse_weekday_indices(yoil)
-        if indices:
-            return [(days_kor[weekday], day_num) for weekday, day_num in all_month_days if weekday in indices]
-        if day_type == "토요일":
-            return [(days_kor[weekday], day_num) for weekday, day_num in all_month_days if weekday == 5]
-        return [(days_kor[weekday], day_num) for weekday, day_num in all_month_days if weekday < 5]
 
-    teacher_to_records = {}
-    for record in records:
-        teacher = record.get("강사")
-        if not isinstance(teacher, str):
-            continue
-        teacher = teacher.strip()
-        if not teacher or teacher.lower() == "nan" or teacher == "강사":
-            continue
-        teacher_to_records.setdefault(teacher, []).append(record)
+def generate_attendance(
+    records,
+    template_path,
+    year=None,
+    month=None,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    template_bytes = read_workbook_bytes(template_path)
+    template = compile_template(template_bytes)
+    workbook = _load_template_workbook(template_bytes)
+    template_ws = workbook.worksheets[0]
+    template_rows = template["rows"]
+    template_cols = template["cols"]
+    student_slots = template["student_slots"]
+    class_rel = template["class_rel"]
+    class_template_value = template["class_template_value"]
+    teacher_rel = template["teacher_rel"]
+    korean_rel = template["korean_rel"]
+    student_start_rel_row = template["student_start_rel_row"]
+    student_last_rel_row = template["student_last_rel_row"]
+    student_name_alignment = copy(template["student_name_alignment"])
+    style_cache = StyleCache()
+
+    used_year, used_month = resolve_year_month(year, month)
+    all_month_days = month_attendance_days(used_year, used_month, manual_holidays, manual_includes)
+    teacher_to_records = group_records_by_teacher(records)
 
     teacher_block_layouts = {}
     for teacher, teacher_records in teacher_to_records.items():
@@ -427,20 +594,16 @@ def generate_attendance(
     for teacher, teacher_records in teacher_to_records.items():
         ws = workbook[teacher]
         for record, (start_row, extra_rows) in zip(teacher_records, teacher_block_layouts[teacher]):
-            course = record.get("과정", "")
-            class_name = course.split("/")[0] if isinstance(course, str) and course.strip() else ""
-            class_name = polish_class_name(class_name)
-            time_value = record.get("시간", "")
-            day_value = record.get("요일", "")
+            class_name = record_class_name(record)
             students = record.get("학생목록", [])
 
             ws.cell(row=start_row + 2, column=2).value = f"{str(used_year)[2:]}년 {used_month}월"
 
             time_cell = ws.cell(row=start_row + 2, column=7)
-            time_cell.value = f"{format_day_display(day_value)} {time_value}"
-            shrink_font_to_fit(time_cell, 20)
+            time_cell.value = record_schedule_text(record)
+            shrink_font_to_fit(time_cell, 20, style_cache=style_cache)
 
-            valid_dates = get_valid_dates_for_record(record)
+            valid_dates = valid_dates_for_record(record, all_month_days, day_type)
             for idx in range(23):
                 weekday_cell = ws.cell(row=start_row + 4, column=7 + idx)
                 date_cell = ws.cell(row=start_row + 5, column=7 + idx)
@@ -453,12 +616,12 @@ def generate_attendance(
 
             if class_rel and class_template_value:
                 class_cell = ws.cell(row=start_row + class_rel[0], column=class_rel[1])
-                set_class_text(class_cell, class_template_value, class_name)
+                set_class_text(class_cell, class_template_value, class_name, style_cache=style_cache)
 
             if teacher_rel:
                 teacher_cell = ws.cell(row=start_row + teacher_rel[0], column=teacher_rel[1])
                 teacher_cell.value = f"담임 강사: {teacher}"
-                shrink_font_to_fit(teacher_cell, 25)
+                shrink_font_to_fit(teacher_cell, 25, style_cache=style_cache)
 
             korean_col = korean_rel[1]
             student_start_row = start_row + student_start_rel_row - 1
@@ -470,14 +633,14 @@ def generate_attendance(
                     continue
                 name_cell = ws.cell(row=student_start_row + idx, column=korean_col)
                 name_cell.value = name
-                name_cell.alignment = copy(student_name_alignment)
-                shrink_font_to_fit(name_cell, 10)
+                name_cell.alignment = student_name_alignment
+                shrink_font_to_fit(name_cell, 10, style_cache=style_cache)
 
                 duration = student_dict.get("duration")
                 if duration:
                     duration_cell = ws.cell(row=student_start_row + idx, column=duration_col)
                     duration_cell.value = preprocess_duration(duration)
-                    duration_cell.font = Font(size=8)
+                    duration_cell.font = _DURATION_FONT
 
             for idx in range(student_slots + extra_rows):
                 ws.cell(row=student_start_row + idx, column=1).value = idx + 1
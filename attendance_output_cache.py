@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from attendance_generator import (
+    GENERATOR_VERSION,
+    generate_attendance,
+    month_attendance_days,
+    read_workbook_bytes,
+    resolve_year_month,
+)
+
+
+def output_fingerprint(
+    records,
+    template_bytes,
+    year,
+    month,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    # Hash the resolved attendance days rather than the manual lists so that a
+    # holidays release with new public holidays does not serve stale headers.
+    payload = {
+        "version": GENERATOR_VERSION,
+        "template": hashlib.sha256(template_bytes).hexdigest(),
+        "year": year,
+        "month": month,
+        "day_type": day_type,
+        "month_days": month_attendance_days(year, month, manual_holidays, manual_includes),
+        "records": records,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """LRU cache of generated workbook bytes with an optional on-disk tier."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None, max_disk_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.xlsx")
+
+    def _remember(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._size -= len(self._entries.pop(key))
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as cached_file:
+                    data = cached_file.read()
+            except OSError:
+                data = None
+            if data is not None:
+                try:
+                    os.utime(self._disk_path(key))
+                except OSError:
+                    pass
+                with self._lock:
+                    self._remember(key, data)
+                    self.disk_hits += 1
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        with self._lock:
+            self._remember(key, data)
+        if self.disk_dir:
+            self._write_disk(key, data)
+
+    def _write_disk(self, key, data):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self._trim_disk()
+
+    def _trim_disk(self):
+        # Another session or process may unlink files while this one trims,
+        # so stat each file once and skip the ones that have vanished.
+        entries = []
+        try:
+            with os.scandir(self.disk_dir) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(".xlsx"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            total -= size
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+def generate_attendance_cached(
+    cache,
+    records,
+    template_path,
+    year=None,
+    month=None,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    """Same as generate_attendance, but reuse bytes generated earlier for identical inputs."""
+    records = list(records)
+    template_bytes = read_workbook_bytes(template_path)
+    used_year, used_month = resolve_year_month(year, month)
+    key = output_fingerprint(
+        records,
+        template_bytes,
+        used_year,
+        used_month,
+        day_type,
+        manual_holidays,
+        manual_includes,
+    )
+
+    data = cache.get(key)
+    if data is None:
+        data = generate_attendance(
+            records,
+            template_bytes,
+            year=used_year,
+            month=used_month,
+            day_type=day_type,
+            manual_holidays=manual_holidays,
+            manual_includes=manual_includes,
+        ).getvalue()
+        cache.put(key, data)
+    return BytesIO(data)
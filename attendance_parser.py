@@ -1,13 +1,19 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 import openpyxl
-import pandas as pd
 
 from attendance_generator import (
+    as_workbook_source,
     capitalize_first_word_if_english,
     clean_name,
     format_text,
+    read_workbook_bytes,
 )
+from attendance_sheet_cache import sheet_fingerprint
+from attendance_xlsx_reader import ERROR_VALUE, XlsxReader
 
 
 SHEET_CONFIGS = [
@@ -125,68 +131,300 @@ def looks_like_student_name(value):
     return re.fullmatch(r"[A-Za-z가-힣]+", name) is not None
 
 
-def is_summary_row(row, time_value):
-    texts = []
-    for value in row.values:
+def summary_text_flags(values):
+    has_note = has_marker = False
+    for value in values:
         if is_empty(value) or isinstance(value, (int, float)):
             continue
-        texts.append(normalize_text(value))
+        text = normalize_text(value)
+        if text.startswith("※"):
+            has_note = True
+        elif text in SUMMARY_MARKERS:
+            has_marker = True
+    return has_note, has_marker
 
-    if any(text.startswith("※") for text in texts):
-        return True
 
-    return is_empty(time_value) and any(text in SUMMARY_MARKERS for text in texts)
+def is_summary_row(row, time_value):
+    has_note, has_marker = summary_text_flags(row)
+    return has_note or (is_empty(time_value) and has_marker)
 
 
-def _row_looks_like_header(worksheet, row):
-    if row < 1 or row > worksheet.max_row:
-        return False
-    text_cells = []
-    for col in range(1, worksheet.max_column + 1):
-        value = worksheet.cell(row=row, column=col).value
-        if isinstance(value, str):
-            text_cells.append(value)
+def _text_cells_look_like_header(values):
+    text_cells = [value for value in values if isinstance(value, str)]
     has_teacher = any("강사" in text for text in text_cells)
     has_course = any("과정" in text or "구분" in text for text in text_cells)
     has_time = any("시간" in text or text.strip().lower() == "time" for text in text_cells)
     return has_teacher and has_course and has_time
 
 
-def _detect_header_row(worksheet, default_row, search_radius=2):
+def _row_looks_like_header(worksheet, row):
+    if row < 1 or row > worksheet.max_row:
+        return False
+    return _text_cells_look_like_header(
+        worksheet.cell(row=row, column=col).value
+        for col in range(1, worksheet.max_column + 1)
+    )
+
+
+def _mapped_row_looks_like_header(rows, row):
+    return _text_cells_look_like_header(rows.get(row, {}).values())
+
+
+def _detect_header_row(worksheet, default_row, search_radius=2, row_looks_like_header=_row_looks_like_header):
     candidates = [default_row]
     for offset in range(1, search_radius + 1):
         candidates.extend([default_row - offset, default_row + offset])
     for row in candidates:
-        if _row_looks_like_header(worksheet, row):
+        if row_looks_like_header(worksheet, row):
             return row
     return default_row
 
 
-def parse_sheet(workbook_path, sheet_name, header_row, day_col_idx=None, preferred_course_col=None):
-    workbook = openpyxl.load_workbook(workbook_path, data_only=False)
+def _load_sheet_openpyxl(workbook_path, sheet_name, header_row):
+    import pandas as pd
+
+    workbook = openpyxl.load_workbook(as_workbook_source(workbook_path), data_only=False)
     if sheet_name not in workbook.sheetnames:
-        return []
+        return None
 
     try:
         worksheet = workbook[sheet_name]
     except KeyError:
-        return []
+        return None
 
     header_row = _detect_header_row(worksheet, header_row)
 
-    df = pd.read_excel(
-        workbook_path,
-        header=header_row - 1,
-        sheet_name=sheet_name,
-        engine="openpyxl",
+    def read_excel(**options):
+        return pd.read_excel(
+            as_workbook_source(workbook_path),
+            header=header_row - 1,
+            sheet_name=sheet_name,
+            engine="openpyxl",
+            **options,
+        )
+
+    columns = list(read_excel(nrows=0).columns)
+
+    def read_rows(positions=None):
+        if positions is None:
+            for row in read_excel().itertuples(index=False, name=None):
+                yield row, False, False
+            return
+
+        df = read_excel(usecols=positions)
+        wanted = set(positions)
+        skipped_flags = [
+            summary_text_flags(
+                value for col_idx, value in enumerate(values) if col_idx not in wanted
+            )
+            for values in worksheet.iter_rows(min_row=header_row + 1, values_only=True)
+        ]
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None)):
+            has_note, has_marker = skipped_flags[row_idx] if row_idx < len(skipped_flags) else (False, False)
+            yield row, has_note, has_marker
+
+    def comment_text(row, column):
+        comment = worksheet.cell(row=row, column=column).comment
+        return comment.text if comment else None
+
+    return header_row, columns, read_rows, comment_text
+
+
+# Mirrors the strings pandas.read_excel treats as missing by default.
+_PANDAS_NA_STRINGS = {
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+}
+
+_NAN = float("nan")
+
+
+def _pandas_cell(value):
+    if value is ERROR_VALUE:
+        return _NAN
+    if isinstance(value, str):
+        return _NAN if value in _PANDAS_NA_STRINGS else value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _dedupe_column_names(names):
+    names = list(names)
+    counts = {}
+    for idx, name in enumerate(names):
+        cur_count = counts.get(name, 0)
+        while cur_count > 0:
+            counts[name] = cur_count + 1
+            name = f"{name}.{cur_count}"
+            cur_count = counts.get(name, 0)
+        names[idx] = name
+        counts[name] = cur_count + 1
+    return names
+
+
+def _is_numeric_cell(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _coerce_numeric_columns(data, width):
+    # pandas stores a numeric column with gaps as float64. Gaps in an all-date
+    # column stay NaN here instead of pandas' NaT.
+    for col_idx in range(width):
+        column_values = [row[col_idx] for row in data]
+        present = [value for value in column_values if not is_empty(value)]
+        if len(present) < len(column_values) and present and all(_is_numeric_cell(value) for value in present):
+            for row in data:
+                if not is_empty(row[col_idx]):
+                    row[col_idx] = float(row[col_idx])
+
+
+def _load_sheet_xml(workbook_path, sheet_name, header_row, search_radius=2):
+    owns_reader = not isinstance(workbook_path, XlsxReader)
+
+    def open_reader():
+        return XlsxReader(workbook_path) if owns_reader else nullcontext(workbook_path)
+
+    with open_reader() as reader:
+        if reader.sheet_part(sheet_name) is None:
+            return None
+        head_rows = dict(reader.iter_rows(sheet_name, max_row=header_row + search_radius))
+        comments = reader.comments(sheet_name)
+
+    header_row = _detect_header_row(
+        head_rows,
+        header_row,
+        search_radius,
+        row_looks_like_header=_mapped_row_looks_like_header,
     )
-    df.columns = [
+
+    def filled_width(rows):
+        width = 0
+        for values in rows:
+            filled = [col for col, value in values.items() if value != ""]
+            if filled:
+                width = max(width, max(filled))
+        return width
+
+    header_values = head_rows.get(header_row, {})
+    columns = []
+    for col in range(1, filled_width(head_rows.values()) + 1):
+        label = header_values.get(col, "")
+        if label == "" or label is ERROR_VALUE:
+            label = f"Unnamed: {col - 1}"
+        elif isinstance(label, float) and label.is_integer():
+            label = int(label)
+        columns.append(label)
+    columns = _dedupe_column_names(columns)
+
+    def read_rows(positions=None):
+        with open_reader() as reader:
+            if positions is None:
+                rows = {
+                    row_number: (values, ())
+                    for row_number, values in reader.iter_rows(sheet_name, min_row=header_row + 1)
+                }
+                width = max(len(columns), filled_width(values for values, _ in rows.values()))
+                col_numbers = range(1, width + 1)
+            else:
+                col_numbers = [position + 1 for position in positions]
+                rows = {
+                    row_number: (values, other_texts)
+                    for row_number, values, other_texts in reader.iter_projected_rows(
+                        sheet_name,
+                        col_numbers,
+                        min_row=header_row + 1,
+                    )
+                }
+
+        last_row = max(rows, default=header_row)
+        data = []
+        flags = []
+        for row_number in range(header_row + 1, last_row + 1):
+            values, other_texts = rows.get(row_number, ({}, ()))
+            data.append([_pandas_cell(values.get(col, "")) for col in col_numbers])
+            flags.append(summary_text_flags(_pandas_cell(text) for text in other_texts))
+        _coerce_numeric_columns(data, len(col_numbers))
+
+        for row, (has_note, has_marker) in zip(data, flags):
+            yield row, has_note, has_marker
+
+    def comment_text(row, column):
+        return comments.get((row, column))
+
+    return header_row, columns, read_rows, comment_text
+
+
+PARSE_ENGINES = {
+    "openpyxl": _load_sheet_openpyxl,
+    "xml": _load_sheet_xml,
+}
+
+
+def parse_sheet(
+    workbook_path,
+    sheet_name,
+    header_row,
+    day_col_idx=None,
+    preferred_course_col=None,
+    engine="openpyxl",
+    project_columns=True,
+):
+    return list(
+        iter_sheet_records(
+            workbook_path,
+            sheet_name,
+            header_row,
+            day_col_idx,
+            preferred_course_col,
+            engine=engine,
+            project_columns=project_columns,
+        )
+    )
+
+
+def iter_sheet_records(
+    workbook_path,
+    sheet_name,
+    header_row,
+    day_col_idx=None,
+    preferred_course_col=None,
+    engine="openpyxl",
+    project_columns=True,
+):
+    """Yield each class record of a sheet as soon as its run of rows is flushed."""
+    if engine not in PARSE_ENGINES:
+        raise ValueError(f"Unknown parse engine: {engine!r}")
+
+    loaded = PARSE_ENGINES[engine](workbook_path, sheet_name, header_row)
+    if loaded is None:
+        return
+    header_row, columns, read_rows, comment_text = loaded
+
+    columns = [
         column if isinstance(column, (int, float)) else str(column).strip()
-        for column in df.columns
+        for column in columns
     ]
 
     def find(keywords, exclude=()):
-        for column in df.columns:
+        for column in columns:
             label = str(column).strip()
             if any(keyword.lower() in label.lower() for keyword in keywords):
                 if not any(ex.lower() in label.lower() for ex in exclude):
@@ -196,51 +434,75 @@ def parse_sheet(workbook_path, sheet_name, header_row, day_col_idx=None, preferr
     teacher_col = find(["강사"], exclude=["인원", "보"])
     time_col = find(["시간", "time"])
 
-    course_col = preferred_course_col if preferred_course_col in df.columns else None
+    course_col = preferred_course_col if preferred_course_col in columns else None
     if course_col is None:
         course_col = find(["과정"]) or find(["구분2"]) or find(["구분1"])
 
-    if day_col_idx is not None and 0 < day_col_idx <= len(df.columns):
-        day_col = df.columns[day_col_idx - 1]
+    if day_col_idx is not None and 0 < day_col_idx <= len(columns):
+        day_col = columns[day_col_idx - 1]
     else:
         day_col = find(["요일"])
 
     student_cols = [
-        column for column in df.columns
+        column for column in columns
         if isinstance(column, (int, float)) and 1 <= column <= 20
     ]
     student_col_positions = {
-        column: list(df.columns).index(column) + 1
+        column: columns.index(column) + 1
         for column in student_cols
     }
 
     if not teacher_col:
-        return []
+        return
+
+    label_positions = [
+        columns.index(column)
+        for column in (teacher_col, day_col, time_col, course_col, *student_cols)
+        if column is not None
+    ]
+    if project_columns:
+        positions = sorted(set(label_positions))
+        rows = read_rows(positions)
+        row_index = {position: idx for idx, position in enumerate(positions)}
+    else:
+        rows = read_rows(None)
+        row_index = {position: position for position in label_positions}
+
+    teacher_pos = row_index[columns.index(teacher_col)]
+    day_pos = row_index[columns.index(day_col)] if day_col else None
+    time_pos = row_index[columns.index(time_col)] if time_col else None
+    course_pos = row_index[columns.index(course_col)] if course_col else None
 
-    records = []
     cur = dict(teacher=None, day=None, time=None, course=None, students=[])
 
     def flush():
         if cur["teacher"] and cur["students"]:
-            records.append({
+            return {
                 "강사": normalize_teacher_name(cur["teacher"]),
                 "과정": format_text(str(cur["course"])) if cur["course"] else "",
                 "요일": format_text(str(cur["day"])) if cur["day"] else "",
                 "시간": format_text(str(cur["time"])) if cur["time"] else "",
                 "학생목록": cur["students"][:],
-            })
+            }
+        return None
 
-    for row_idx, row in df.iterrows():
+    for row_idx, (row, skipped_note, skipped_marker) in enumerate(rows):
         excel_row = header_row + 1 + row_idx
 
-        teacher_value = row.get(teacher_col) if teacher_col else None
-        day_value = row.get(day_col) if day_col else None
-        time_value = row.get(time_col) if time_col else None
-        course_value = row.get(course_col) if course_col else None
-
-        if is_summary_row(row, time_value):
-            flush()
-            break
+        teacher_value = row[teacher_pos]
+        day_value = row[day_pos] if day_pos is not None else None
+        time_value = row[time_pos] if time_pos is not None else None
+        course_value = row[course_pos] if course_pos is not None else None
+
+        if (
+            skipped_note
+            or (skipped_marker and is_empty(time_value))
+            or is_summary_row(row, time_value)
+        ):
+            record = flush()
+            if record:
+                yield record
+            return
 
         teacher_new = not is_empty(teacher_value)
         day_new = not is_empty(day_value)
@@ -250,7 +512,9 @@ def parse_sheet(workbook_path, sheet_name, header_row, day_col_idx=None, preferr
             new_key = (str(teacher_value), str(day_value), str(time_value))
             old_key = (str(cur["teacher"]), str(cur["day"]), str(cur["time"]))
             if new_key != old_key:
-                flush()
+                record = flush()
+                if record:
+                    yield record
                 cur = dict(
                     teacher=str(teacher_value),
                     day=str(day_value) if day_new else cur["day"],
@@ -259,7 +523,9 @@ def parse_sheet(workbook_path, sheet_name, header_row, day_col_idx=None, preferr
                     students=[],
                 )
         elif day_new or time_new:
-            flush()
+            record = flush()
+            if record:
+                yield record
             cur["day"] = str(day_value) if day_new else cur["day"]
             cur["time"] = str(time_value) if time_new else cur["time"]
             cur["course"] = str(course_value) if not is_empty(course_value) else cur["course"]
@@ -269,39 +535,159 @@ def parse_sheet(workbook_path, sheet_name, header_row, day_col_idx=None, preferr
             continue
 
         for student_col in student_cols:
-            value = row.get(student_col)
+            excel_col = student_col_positions[student_col]
+            value = row[row_index[excel_col - 1]]
             if not looks_like_student_name(value):
                 continue
 
             student_name = normalize_text(value)
-            excel_col = student_col_positions[student_col]
-            comment_cell = worksheet.cell(row=excel_row, column=excel_col)
-            duration = extract_duration(comment_cell.comment.text if comment_cell.comment else None)
+            duration = extract_duration(comment_text(excel_row, excel_col))
 
             cur["students"].append({
                 "name": student_name,
                 "duration": duration,
             })
 
-    flush()
-    return records
+    record = flush()
+    if record:
+        yield record
+
+
+def _parse_sheet_worker(task):
+    workbook_bytes, sheet_config, engine = task
+    sheet_name, header_row, day_col_idx, preferred_course_col = sheet_config
+    return parse_sheet(
+        workbook_bytes,
+        sheet_name,
+        header_row,
+        day_col_idx,
+        preferred_course_col,
+        engine=engine,
+    )
 
 
-def parse_language_records(workbook_path, sheet_configs=None):
-    records = []
-    workbook = openpyxl.load_workbook(workbook_path, data_only=False)
-    available_sheets = set(workbook.sheetnames)
+def _parse_sheets_in_parallel(workbook_bytes, sheet_configs, engine, max_workers=None):
+    tasks = [(workbook_bytes, sheet_config, engine) for sheet_config in sheet_configs]
+    max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_sheet_worker, tasks))
+
+
+def _iter_sheet_sources(workbook_path, sheet_configs, engine):
+    reader = XlsxReader(workbook_path)
+    try:
+        available_sheets = set(reader.sheetnames)
+        source = reader if engine == "xml" else workbook_path
+        for sheet_config in sheet_configs or SHEET_CONFIGS:
+            if sheet_config[0] in available_sheets:
+                yield reader, source, sheet_config
+    finally:
+        reader.close()
+
+
+def _sheet_cache_key(reader, sheet_config, engine):
+    sheet_name, header_row, day_col_idx, preferred_course_col = sheet_config
+    return sheet_fingerprint(
+        reader,
+        sheet_name,
+        header_row=header_row,
+        day_col_idx=day_col_idx,
+        preferred_course_col=preferred_course_col,
+        engine=engine,
+    )
+
+
+def iter_language_record_batches(workbook_path, sheet_configs=None, engine="openpyxl", sheet_cache=None):
+    """Yield ``(sheet_name, records)`` for each configured sheet as soon as it is parsed.
+
+    With a ``SheetRecordCache``, sheets whose xlsx parts are unchanged since an
+    earlier upload are served from the cache instead of being parsed again.
+    """
+    if hasattr(workbook_path, "read"):
+        workbook_path = read_workbook_bytes(workbook_path)
 
-    for sheet_name, header_row, day_col_idx, preferred_course_col in sheet_configs or SHEET_CONFIGS:
-        if sheet_name not in available_sheets:
+    for reader, source, sheet_config in _iter_sheet_sources(workbook_path, sheet_configs, engine):
+        sheet_name = sheet_config[0]
+        if sheet_cache is None:
+            yield sheet_name, parse_sheet(source, *sheet_config, engine=engine)
             continue
-        records.extend(
-            parse_sheet(
-                workbook_path,
-                sheet_name,
-                header_row,
-                day_col_idx,
-                preferred_course_col,
-            )
+
+        key = _sheet_cache_key(reader, sheet_config, engine)
+        records = sheet_cache.get(sheet_name, key)
+        if records is None:
+            records = parse_sheet(source, *sheet_config, engine=engine)
+            sheet_cache.put(key, records)
+        yield sheet_name, records
+
+
+def iter_language_records(workbook_path, sheet_configs=None, engine="openpyxl", sheet_cache=None):
+    """Yield records one class at a time across all configured sheets."""
+    if hasattr(workbook_path, "read"):
+        workbook_path = read_workbook_bytes(workbook_path)
+
+    for reader, source, sheet_config in _iter_sheet_sources(workbook_path, sheet_configs, engine):
+        if sheet_cache is None:
+            yield from iter_sheet_records(source, *sheet_config, engine=engine)
+            continue
+
+        key = _sheet_cache_key(reader, sheet_config, engine)
+        records = sheet_cache.get(sheet_config[0], key)
+        if records is not None:
+            yield from records
+            continue
+
+        records = []
+        for record in iter_sheet_records(source, *sheet_config, engine=engine):
+            records.append(record)
+            yield record
+        sheet_cache.put(key, records)
+
+
+def parse_language_records(
+    workbook_path,
+    sheet_configs=None,
+    engine="openpyxl",
+    parallel=False,
+    max_workers=None,
+    sheet_cache=None,
+):
+    if hasattr(workbook_path, "read"):
+        workbook_path = read_workbook_bytes(workbook_path)
+
+    if not parallel:
+        return list(iter_language_records(workbook_path, sheet_configs, engine, sheet_cache))
+
+    workbook_bytes = read_workbook_bytes(workbook_path)
+    sheet_results = []
+    pending = []
+    for reader, _, sheet_config in _iter_sheet_sources(workbook_bytes, sheet_configs, engine):
+        key = None
+        records = None
+        if sheet_cache is not None:
+            key = _sheet_cache_key(reader, sheet_config, engine)
+            records = sheet_cache.get(sheet_config[0], key)
+        if records is None:
+            pending.append((len(sheet_results), sheet_config, key))
+        sheet_results.append(records)
+
+    if len(pending) == 1:
+        idx, sheet_config, _ = pending[0]
+        sheet_results[idx] = list(iter_language_records(workbook_bytes, [sheet_config], engine))
+    elif pending:
+        parsed = _parse_sheets_in_parallel(
+            workbook_bytes,
+            [sheet_config for _, sheet_config, _ in pending],
+            engine,
+            max_workers,
         )
+        for (idx, _, _), sheet_records in zip(pending, parsed):
+            sheet_results[idx] = sheet_records
+
+    if sheet_cache is not None:
+        for idx, _, key in pending:
+            sheet_cache.put(key, sheet_results[idx])
+
+    records = []
+    for sheet_records in sheet_results:
+        records.extend(sheet_records)
     return records
@@ -0,0 +1,101 @@
+import json
+from html import escape
+
+from attendance_generator import (
+    group_records_by_teacher,
+    month_attendance_days,
+    preprocess_duration,
+    record_class_name,
+    record_schedule_text,
+    resolve_year_month,
+    valid_dates_for_record,
+)
+
+
+MAX_DATE_COLUMNS = 23
+
+
+def build_preview(
+    records,
+    year=None,
+    month=None,
+    day_type="주중",
+    manual_holidays=None,
+    manual_includes=None,
+):
+    used_year, used_month = resolve_year_month(year, month)
+    month_days = month_attendance_days(used_year, used_month, manual_holidays, manual_includes)
+
+    teachers = []
+    for teacher, teacher_records in group_records_by_teacher(records).items():
+        blocks = []
+        for record in teacher_records:
+            valid_dates = valid_dates_for_record(record, month_days, day_type)
+            blocks.append({
+                "class": record_class_name(record),
+                "schedule": record_schedule_text(record),
+                "dates": [
+                    {"weekday": weekday, "day": day_num}
+                    for weekday, day_num in valid_dates[:MAX_DATE_COLUMNS]
+                ],
+                "students": [
+                    {
+                        "name": student["name"],
+                        "duration": preprocess_duration(student.get("duration")),
+                    }
+                    for student in record.get("학생목록", [])
+                    if student.get("name")
+                ],
+            })
+        teachers.append({"teacher": teacher, "blocks": blocks})
+
+    return {"year": used_year, "month": used_month, "teachers": teachers}
+
+
+def preview_to_json(preview):
+    return json.dumps(preview, ensure_ascii=False, indent=2)
+
+
+_PREVIEW_STYLE = """
+<style>
+.attendance-preview table { border-collapse: collapse; margin-bottom: 1rem; font-size: 0.85rem; }
+.attendance-preview th, .attendance-preview td { border: 1px solid #ccc; padding: 2px 6px; text-align: center; }
+.attendance-preview td.name, .attendance-preview td.duration { text-align: left; }
+</style>
+"""
+
+
+def _block_to_html(block):
+    dates = block["dates"]
+    weekday_cells = "".join(f"<th>{escape(date['weekday'])}</th>" for date in dates)
+    day_cells = "".join(f"<th>{date['day']}</th>" for date in dates)
+    empty_cells = "<td></td>" * len(dates)
+
+    rows = [
+        f"<tr><th rowspan='2'>No</th><th rowspan='2'>학생명</th>"
+        f"<th rowspan='2'>수강기간</th>{weekday_cells}</tr>",
+        f"<tr>{day_cells}</tr>",
+    ]
+    for idx, student in enumerate(block["students"], 1):
+        rows.append(
+            f"<tr><td>{idx}</td><td class='name'>{escape(student['name'])}</td>"
+            f"<td class='duration'>{escape(student['duration'] or '')}</td>{empty_cells}</tr>"
+        )
+
+    return (
+        f"<p><b>CLASS: {escape(block['class'])}</b> · {escape(block['schedule'])}"
+        f" · 수업일수 {len(dates)}일 · 학생 {len(block['students'])}명</p>"
+        f"<table>{''.join(rows)}</table>"
+    )
+
+
+def preview_to_html(preview):
+    parts = [_PREVIEW_STYLE, "<div class='attendance-preview'>"]
+    for teacher in preview["teachers"]:
+        parts.append(
+            f"<h4>담임 강사: {escape(teacher['teacher'])} "
+            f"({str(preview['year'])[2:]}년 {preview['month']}월)</h4>"
+        )
+        parts.extend(_block_to_html(block) for block in teacher["blocks"])
+    parts.append("</div>")
+    return "".join(parts)
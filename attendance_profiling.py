@@ -0,0 +1,179 @@
+import cProfile
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+
+
+PROFILE_ENV = "ATTENDANCE_PROFILE"
+PROFILE_DIR_ENV = "ATTENDANCE_PROFILE_DIR"
+PROFILE_RATE_ENV = "ATTENDANCE_PROFILE_RATE"
+PROFILE_KEEP_ENV = "ATTENDANCE_PROFILE_KEEP"
+
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_PROFILE_KEEP = 50
+MAX_STACK_DEPTH = 64
+MIN_STACK_SHARE = 0.0005
+
+_settings = {}
+_active = threading.Lock()
+_sequence = count(1)
+
+
+def _env_settings():
+    try:
+        rate = float(os.environ.get(PROFILE_RATE_ENV, "1"))
+    except ValueError:
+        rate = 1.0
+    try:
+        keep = int(os.environ.get(PROFILE_KEEP_ENV, str(DEFAULT_PROFILE_KEEP)))
+    except ValueError:
+        keep = DEFAULT_PROFILE_KEEP
+    return {
+        "enabled": os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on"),
+        "directory": os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR,
+        "rate": rate,
+        "keep": keep,
+    }
+
+
+def configure(enabled=None, directory=None, rate=None, keep=None):
+    """Override the environment settings, e.g. from a ``--profile`` CLI flag."""
+    overrides = {"enabled": enabled, "directory": directory, "rate": rate, "keep": keep}
+    _settings.update({key: value for key, value in overrides.items() if value is not None})
+
+
+def profile_settings():
+    return {**_env_settings(), **_settings}
+
+
+def _artifact_stem(directory, name):
+    safe_name = re.sub(r"[^\w.-]+", "_", name).strip("_") or "profile"
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(directory, f"{timestamp}-{safe_name}-{os.getpid()}-{next(_sequence)}")
+
+
+def _func_label(func):
+    filename, line, func_name = func
+    if filename == "~":
+        return func_name.strip("<>").replace(";", ":")
+    return f"{os.path.basename(filename)}:{func_name}:{line}".replace(";", ":")
+
+
+def collapsed_stacks(stats):
+    """Rebuild ``frame;frame;frame microseconds`` lines from cProfile's caller graph.
+
+    cProfile only records caller → callee edges, so time through a function
+    reached from several callers is split in proportion to each edge, and
+    paths under 0.05% of the total are dropped.
+    """
+    callees = {}
+    roots = []
+    for func, (_, _, _, cumulative, callers) in stats.stats.items():
+        if not callers:
+            roots.append((func, cumulative))
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_cumulative))
+
+    lines = {}
+    min_share = sum(cumulative for _, cumulative in roots) * MIN_STACK_SHARE
+
+    def walk(func, share, path):
+        _, _, own_time, cumulative, _ = stats.stats[func]
+        if cumulative <= 0 or share <= min_share:
+            return
+        fraction = min(1.0, share / cumulative)
+        path = (*path, _func_label(func))
+        key = ";".join(path)
+        lines[key] = lines.get(key, 0.0) + own_time * fraction
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_cumulative in callees.get(func, []):
+            if _func_label(callee) not in path:
+                walk(callee, edge_cumulative * fraction, path)
+
+    for func, cumulative in roots:
+        walk(func, cumulative, ())
+
+    return [
+        f"{stack} {round(seconds * 1_000_000)}"
+        for stack, seconds in sorted(lines.items())
+        if round(seconds * 1_000_000) > 0
+    ]
+
+
+def _write_artifacts(profiler, stem):
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(f"{stem}.pstats")
+    with open(f"{stem}.collapsed.txt", "w", encoding="utf-8") as collapsed_file:
+        for line in collapsed_stacks(stats):
+            collapsed_file.write(line)
+            collapsed_file.write("\n")
+
+
+def _trim_artifacts(directory, keep):
+    try:
+        entries = [
+            entry for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.endswith((".pstats", ".collapsed.txt"))
+        ]
+    except OSError:
+        return
+    stems = {}
+    for entry in entries:
+        stem = entry.name.rsplit(".collapsed.txt", 1)[0].rsplit(".pstats", 1)[0]
+        stems.setdefault(stem, []).append(entry)
+    ordered = sorted(stems.values(), key=lambda group: max(entry.stat().st_mtime for entry in group))
+    for group in ordered[:max(0, len(ordered) - keep)]:
+        for entry in group:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                continue
+
+
+@contextmanager
+def profile_section(name):
+    """Profile the enclosed block with cProfile when profiling is enabled and this request is sampled.
+
+    Yields the artifact path stem, or None when the block runs unprofiled. Only
+    one block is profiled at a time per process; concurrent or nested blocks
+    simply run without a profiler, and failures writing the artifacts never
+    reach the caller.
+    """
+    settings = profile_settings()
+    if not settings["enabled"] or random.random() >= settings["rate"]:
+        yield None
+        return
+    if not _active.acquire(blocking=False):
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        try:
+            os.makedirs(settings["directory"], exist_ok=True)
+            stem = _artifact_stem(settings["directory"], name)
+            profiler.enable()
+        except (OSError, ValueError):
+            # ValueError: another profiler or debugger already owns the hook.
+            stem = None
+        if stem is None:
+            yield None
+            return
+
+        try:
+            yield stem
+        finally:
+            profiler.disable()
+            try:
+                _write_artifacts(profiler, stem)
+                _trim_artifacts(settings["directory"], settings["keep"])
+            except OSError:
+                pass
+    finally:
+        _active.release()
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+
+
+_SHARED_STRING_REF_RE = re.compile(
+    rb"<(?:\w+:)?c\b[^>]*?\bt=[\"']s[\"'][^>]*>\s*<(?:\w+:)?v>\s*(\d+)\s*<"
+)
+
+
+def sheet_fingerprint(reader, sheet_name, **parse_options):
+    """Hash everything a sheet's records depend on inside the xlsx zip.
+
+    That is the sheet XML part, its comments parts, the shared strings the
+    sheet actually references and the date style table, so edits to other
+    sheets leave the fingerprint unchanged.
+    """
+    part = reader.sheet_part(sheet_name)
+    if part is None:
+        return None
+
+    digest = hashlib.sha256()
+    header = {
+        "sheet": sheet_name,
+        "options": parse_options,
+        "conversion": reader.conversion_signature(),
+    }
+    digest.update(json.dumps(header, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"))
+
+    sheet_xml = reader.read_part(part)
+    digest.update(b"\0sheet\0")
+    digest.update(sheet_xml)
+
+    for comment_part in sorted(reader.comment_parts(sheet_name)):
+        digest.update(b"\0comments\0")
+        digest.update(reader.read_part(comment_part))
+
+    shared_strings = reader.shared_strings
+    digest.update(b"\0strings\0")
+    for index in sorted({int(match) for match in _SHARED_STRING_REF_RE.findall(sheet_xml)}):
+        text = shared_strings[index] if index < len(shared_strings) else ""
+        digest.update(f"{index}\0{text}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SheetRecordCache:
+    """LRU cache of parsed records per sheet fingerprint, with per-sheet hit/miss counts."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def _count(self, sheet_name, outcome):
+        counts = self._counts.setdefault(sheet_name, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+    def get(self, sheet_name, key):
+        with self._lock:
+            records = self._entries.get(key) if key is not None else None
+            if records is None:
+                self._count(sheet_name, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(sheet_name, "hits")
+            return list(records)
+
+    def put(self, key, records):
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = tuple(records)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "sheets": {sheet_name: dict(counts) for sheet_name, counts in self._counts.items()},
+            }
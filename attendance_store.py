@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""파싱된 수업 기록을 월별로 저장하고 조회하는 SQLite 저장소."""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+from attendance_generator import read_workbook_bytes
+
+
+DEFAULT_DB_PATH = os.environ.get("ATTENDANCE_DB", "attendance_history.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    file_hash TEXT NOT NULL UNIQUE,
+    file_name TEXT,
+    month TEXT NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS classes (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    month TEXT NOT NULL,
+    teacher TEXT NOT NULL,
+    course TEXT,
+    day TEXT,
+    time TEXT
+);
+CREATE TABLE IF NOT EXISTS enrollments (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL REFERENCES classes(id) ON DELETE CASCADE,
+    month TEXT NOT NULL,
+    student TEXT NOT NULL,
+    duration TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_classes_teacher_month ON classes(teacher, month);
+CREATE INDEX IF NOT EXISTS idx_classes_month ON classes(month);
+CREATE INDEX IF NOT EXISTS idx_enrollments_student_month ON enrollments(student, month);
+CREATE INDEX IF NOT EXISTS idx_enrollments_month ON enrollments(month);
+CREATE INDEX IF NOT EXISTS idx_enrollments_class ON enrollments(class_id);
+"""
+
+
+def connect(db_path=DEFAULT_DB_PATH):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def normalize_month(month):
+    match = re.fullmatch(r"\s*(\d{4})\D?(\d{1,2})\s*", str(month))
+    if not match:
+        raise ValueError(f"Month must look like YYYY-MM: {month!r}")
+    year, month_num = int(match.group(1)), int(match.group(2))
+    if not 1 <= month_num <= 12:
+        raise ValueError(f"Month must look like YYYY-MM: {month!r}")
+    return f"{year:04d}-{month_num:02d}"
+
+
+def file_hash(source):
+    return hashlib.sha256(read_workbook_bytes(source)).hexdigest()
+
+
+def source_month(conn, source_hash):
+    row = conn.execute("SELECT month FROM sources WHERE file_hash = ?", (source_hash,)).fetchone()
+    return row["month"] if row else None
+
+
+def has_source(conn, source_hash):
+    return source_month(conn, source_hash) is not None
+
+
+def ingest_records(conn, records, source_hash, month, file_name=None):
+    """Store parsed records once per source hash; return the class count or None if already stored."""
+    month = normalize_month(month)
+    if has_source(conn, source_hash):
+        return None
+
+    with conn:
+        source_id = conn.execute(
+            "INSERT INTO sources (file_hash, file_name, month, ingested_at) VALUES (?, ?, ?, ?)",
+            (source_hash, file_name, month, datetime.now().isoformat(timespec="seconds")),
+        ).lastrowid
+        for record in records:
+            class_id = conn.execute(
+                "INSERT INTO classes (source_id, month, teacher, course, day, time) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    source_id,
+                    month,
+                    record.get("강사", ""),
+                    record.get("과정", ""),
+                    record.get("요일", ""),
+                    record.get("시간", ""),
+                ),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO enrollments (class_id, month, student, duration, position) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (class_id, month, student["name"], student.get("duration"), position)
+                    for position, student in enumerate(record.get("학생목록", []))
+                    if student.get("name")
+                ],
+            )
+    return len(records)
+
+
+def ingest_workbook(conn, source, month, file_name=None, **parse_options):
+    """Parse and store a timetable workbook unless its content hash is already stored."""
+    from attendance_parser import parse_language_records
+
+    month = normalize_month(month)
+    workbook_bytes = read_workbook_bytes(source)
+    source_hash = file_hash(workbook_bytes)
+    if has_source(conn, source_hash):
+        return None
+    if file_name is None and isinstance(source, (str, os.PathLike)):
+        file_name = os.path.basename(source)
+    records = parse_language_records(workbook_bytes, **parse_options)
+    return ingest_records(conn, records, source_hash, month, file_name)
+
+
+def _month_filter(year=None, month=None, table="c"):
+    if month is not None:
+        return f"AND {table}.month = ?", [normalize_month(month)]
+    if year is not None:
+        return f"AND {table}.month LIKE ?", [f"{int(year):04d}-%"]
+    return "", []
+
+
+def student_history(conn, student, year=None, month=None):
+    # Filter on enrollments.month so idx_enrollments_student_month covers the lookup.
+    month_sql, params = _month_filter(year, month, table="e")
+    rows = conn.execute(
+        f"""
+        SELECT c.month, c.teacher, c.course, c.day, c.time, e.duration
+        FROM enrollments e
+        JOIN classes c ON c.id = e.class_id
+        WHERE e.student = ? {month_sql}
+        ORDER BY c.month, c.teacher, c.course
+        """,
+        [student, *params],
+    )
+    return [dict(row) for row in rows]
+
+
+def teacher_history(conn, teacher, year=None, month=None):
+    month_sql, params = _month_filter(year, month)
+    rows = conn.execute(
+        f"""
+        SELECT c.month, c.course, c.day, c.time, COUNT(e.id) AS students
+        FROM classes c
+        LEFT JOIN enrollments e ON e.class_id = c.id
+        WHERE c.teacher = ? {month_sql}
+        GROUP BY c.id
+        ORDER BY c.month, c.course
+        """,
+        [teacher, *params],
+    )
+    return [dict(row) for row in rows]
+
+
+def class_roster(conn, teacher, month):
+    rows = conn.execute(
+        """
+        SELECT c.course, c.day, c.time, e.student, e.duration
+        FROM classes c
+        JOIN enrollments e ON e.class_id = c.id
+        WHERE c.teacher = ? AND c.month = ?
+        ORDER BY c.id, e.position
+        """,
+        (teacher, normalize_month(month)),
+    )
+    return [dict(row) for row in rows]
+
+
+def list_sources(conn):
+    rows = conn.execute(
+        """
+        SELECT s.month, s.file_name, s.file_hash, s.ingested_at, COUNT(c.id) AS classes
+        FROM sources s
+        LEFT JOIN classes c ON c.source_id = s.id
+        GROUP BY s.id
+        ORDER BY s.month, s.ingested_at
+        """
+    )
+    return [dict(row) for row in rows]
+
+
+def _print_rows(rows, columns):
+    if not rows:
+        print("결과 없음")
+        return
+    for row in rows:
+        print(" | ".join("" if row[column] is None else str(row[column]) for column in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="출석부 수업 기록 저장소")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite 파일 경로")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="시간표 엑셀 파일 저장")
+    ingest.add_argument("workbook")
+    ingest.add_argument("month", help="YYYY-MM")
+    ingest.add_argument("--engine", default="openpyxl", choices=["openpyxl", "xml"])
+
+    student = commands.add_parser("student", help="학생 수강 이력 조회")
+    student.add_argument("name")
+    student.add_argument("--year", type=int)
+    student.add_argument("--month")
+
+    teacher = commands.add_parser("teacher", help="강사 수업 이력 조회")
+    teacher.add_argument("name")
+    teacher.add_argument("--year", type=int)
+    teacher.add_argument("--month")
+
+    roster = commands.add_parser("roster", help="강사의 월별 수업 명단 조회")
+    roster.add_argument("name")
+    roster.add_argument("month", help="YYYY-MM")
+
+    commands.add_parser("sources", help="저장된 파일 목록")
+
+    args = parser.parse_args(argv)
+    if getattr(args, "month", None) is not None:
+        try:
+            normalize_month(args.month)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    conn = connect(args.db)
+    try:
+        if args.command == "ingest":
+            stored_month = source_month(conn, file_hash(args.workbook))
+            stored = None
+            if stored_month is None:
+                stored = ingest_workbook(conn, args.workbook, args.month, engine=args.engine)
+            if stored is None:
+                print(f"이미 저장된 파일입니다 (저장된 월: {stored_month or normalize_month(args.month)}). 건너뜁니다.")
+            else:
+                print(f"저장 완료: 수업 {stored}개 ({normalize_month(args.month)})")
+        elif args.command == "student":
+            _print_rows(
+                student_history(conn, args.name, args.year, args.month),
+                ["month", "teacher", "course", "day", "time", "duration"],
+            )
+        elif args.command == "teacher":
+            _print_rows(
+                teacher_history(conn, args.name, args.year, args.month),
+                ["month", "course", "day", "time", "students"],
+            )
+        elif args.command == "roster":
+            _print_rows(
+                class_roster(conn, args.name, args.month),
+                ["course", "day", "time", "student", "duration"],
+            )
+        elif args.command == "sources":
+            _print_rows(list_sources(conn), ["month", "file_name", "classes", "ingested_at", "file_hash"])
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
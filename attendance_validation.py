@@ -0,0 +1,155 @@
+import heapq
+import re
+
+from attendance_generator import DAYS_KOR, format_day_display, parse_weekday_indices
+
+
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2})\s*(?:[:.시]\s*(\d{2})?)?\s*분?\s*-\s*(\d{1,2})\s*(?:[:.시]\s*(\d{2})?)?"
+)
+
+
+def parse_time_interval(time_str):
+    """Return ``(start_minute, end_minute)`` for text such as ``18:30-20:00``.
+
+    Text holding several ranges (``19:00-21:00/토 10:00-12:00``) returns None,
+    since the ranges cannot be matched to their weekdays reliably.
+    """
+    matches = list(_TIME_RANGE_RE.finditer(str(time_str or "")))
+    if len(matches) != 1:
+        return None
+    match = matches[0]
+    start_hour, start_minute, end_hour, end_minute = match.groups()
+    start = int(start_hour) * 60 + int(start_minute or 0)
+    end = int(end_hour) * 60 + int(end_minute or 0)
+    if end <= start and end + 12 * 60 > start:
+        end += 12 * 60
+    if end <= start or end > 24 * 60:
+        return None
+    return start, end
+
+
+def _record_label(record):
+    return (
+        f"{record.get('강사', '')} · {record.get('과정', '')} · "
+        f"{format_day_display(record.get('요일', ''))} {record.get('시간', '')}"
+    )
+
+
+def _overlapping_pairs(intervals):
+    """Yield overlapping pairs from ``(start, end, item)`` triples in O(n log n + k)."""
+    active = []
+    for start, end, item in sorted(intervals, key=lambda interval: (interval[0], interval[1])):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, other in active:
+            yield other, item
+        heapq.heappush(active, (end, item))
+
+
+def _build_slots(records, labels):
+    slots = []
+    unparsed = []
+    for record_idx, record in enumerate(records):
+        weekdays = parse_weekday_indices(record.get("요일", ""))
+        interval = parse_time_interval(record.get("시간", ""))
+        if not weekdays or interval is None:
+            unparsed.append({"record": record_idx, "label": labels[record_idx]})
+            continue
+        slots.append((record_idx, weekdays, interval))
+    return slots, unparsed
+
+
+def _find_conflicts(index, key_name, labels):
+    conflicts = {}
+    for (key, weekday), intervals in index.items():
+        for first, second in _overlapping_pairs(intervals):
+            pair = (key, min(first, second), max(first, second))
+            conflict = conflicts.get(pair)
+            if conflict is None:
+                conflict = conflicts[pair] = {
+                    key_name: key,
+                    "weekdays": [],
+                    "records": [pair[1], pair[2]],
+                    "labels": [labels[pair[1]], labels[pair[2]]],
+                }
+            conflict["weekdays"].append(weekday)
+
+    for conflict in conflicts.values():
+        conflict["weekdays"] = [DAYS_KOR[weekday] for weekday in sorted(conflict["weekdays"])]
+    return list(conflicts.values())
+
+
+def validate_records(records):
+    """Flag overlapping teacher slots, clashing student enrolments and duplicate students.
+
+    Records are indexed per (teacher, weekday) and per (student, weekday), and
+    each bucket is swept once in start-time order instead of comparing every
+    pair of classes.
+    """
+    records = list(records)
+    labels = [_record_label(record) for record in records]
+    slots, unparsed = _build_slots(records, labels)
+
+    teacher_index = {}
+    student_index = {}
+    duplicate_students = []
+    for record_idx, weekdays, (start, end) in slots:
+        record = records[record_idx]
+        teacher = record.get("강사")
+        names = [student.get("name") for student in record.get("학생목록", []) if student.get("name")]
+        for weekday in weekdays:
+            if teacher:
+                teacher_index.setdefault((teacher, weekday), []).append((start, end, record_idx))
+            for name in set(names):
+                student_index.setdefault((name, weekday), []).append((start, end, record_idx))
+
+    for record_idx, record in enumerate(records):
+        counts = {}
+        for student in record.get("학생목록", []):
+            if student.get("name"):
+                counts[student["name"]] = counts.get(student["name"], 0) + 1
+        for name, count in counts.items():
+            if count > 1:
+                duplicate_students.append({
+                    "student": name,
+                    "count": count,
+                    "record": record_idx,
+                    "label": labels[record_idx],
+                })
+
+    return {
+        "teacher_conflicts": _find_conflicts(teacher_index, "teacher", labels),
+        "student_conflicts": _find_conflicts(student_index, "student", labels),
+        "duplicate_students": duplicate_students,
+        "unparsed": unparsed,
+    }
+
+
+def has_issues(report):
+    return bool(
+        report["teacher_conflicts"]
+        or report["student_conflicts"]
+        or report["duplicate_students"]
+    )
+
+
+def report_messages(report):
+    messages = []
+    for conflict in report["teacher_conflicts"]:
+        messages.append(
+            f"[강사 시간 중복] {conflict['teacher']} ({''.join(conflict['weekdays'])}): "
+            f"{conflict['labels'][0]} ↔ {conflict['labels'][1]}"
+        )
+    for conflict in report["student_conflicts"]:
+        messages.append(
+            f"[학생 시간 중복] {conflict['student']} ({''.join(conflict['weekdays'])}): "
+            f"{conflict['labels'][0]} ↔ {conflict['labels'][1]}"
+        )
+    for duplicate in report["duplicate_students"]:
+        messages.append(
+            f"[학생 중복 등록] {duplicate['student']} {duplicate['count']}회: {duplicate['label']}"
+        )
+    for item in report["unparsed"]:
+        messages.append(f"[요일/시간 해석 불가] {item['label']}")
+    return messages
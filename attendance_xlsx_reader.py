@@ -0,0 +1,330 @@
+import posixpath
+import zipfile
+
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_ISO8601,
+    from_excel,
+)
+from openpyxl.xml.functions import fromstring, iterparse
+
+from attendance_generator import as_workbook_source
+
+
+_REL_TYPE_OFFICE_DOCUMENT = "/officeDocument"
+_REL_TYPE_SHARED_STRINGS = "/sharedStrings"
+_REL_TYPE_STYLES = "/styles"
+_REL_TYPE_COMMENTS = "/comments"
+
+_TEXT_CELL_TYPES = ("s", "inlineStr", "str")
+
+ERROR_VALUE = object()
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text_content(node):
+    snippets = []
+    for child in node:
+        name = _local(child.tag)
+        if name == "t":
+            snippets.append(child.text or "")
+        elif name == "r":
+            for run_child in child:
+                if _local(run_child.tag) == "t":
+                    snippets.append(run_child.text or "")
+    return "".join(snippets)
+
+
+def _cast_number(text):
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _rels_path(part):
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def _resolve_target(part, target):
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+
+
+def _column_index(reference):
+    letters = reference.rstrip("0123456789")
+    return column_index_from_string(letters)
+
+
+class XlsxReader:
+    """Read cell values and comments straight from the xlsx XML parts.
+
+    Values follow openpyxl's ``data_only=True`` conventions: cached formula
+    results, shared/inline strings as plain text, and date-styled numbers as
+    datetimes. Error cells are returned as ``ERROR_VALUE``.
+    """
+
+    def __init__(self, source):
+        self._archive = zipfile.ZipFile(as_workbook_source(source))
+        self._names = set(self._archive.namelist())
+        self._workbook_part = self._find_workbook_part()
+        self._rels = self._read_rels(self._workbook_part)
+        self._sheets, self._epoch = self._read_workbook()
+        self._shared_strings = None
+        self._date_styles = None
+        self._timedelta_styles = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._archive.close()
+
+    @property
+    def sheetnames(self):
+        return list(self._sheets)
+
+    def sheet_part(self, sheet_name):
+        return self._sheets.get(sheet_name)
+
+    def read_part(self, part):
+        return self._archive.read(part)
+
+    def _find_workbook_part(self):
+        for rel_type, target in self._read_rels("").values():
+            if rel_type.endswith(_REL_TYPE_OFFICE_DOCUMENT):
+                return target
+        return "xl/workbook.xml"
+
+    def _read_rels(self, part):
+        rels_path = "_rels/.rels" if not part else _rels_path(part)
+        if rels_path not in self._names:
+            return {}
+        rels = {}
+        root = fromstring(self._archive.read(rels_path))
+        for rel in root:
+            if rel.get("TargetMode") == "External":
+                continue
+            rels[rel.get("Id")] = (rel.get("Type", ""), _resolve_target(part, rel.get("Target", "")))
+        return rels
+
+    def _part_for_type(self, rel_type):
+        for candidate_type, target in self._rels.values():
+            if candidate_type.endswith(rel_type):
+                return target
+        return None
+
+    def _read_workbook(self):
+        root = fromstring(self._archive.read(self._workbook_part))
+        sheets = {}
+        epoch = CALENDAR_WINDOWS_1900
+        for node in root.iter():
+            name = _local(node.tag)
+            if name == "workbookPr" and node.get("date1904") in ("1", "true"):
+                epoch = CALENDAR_MAC_1904
+            elif name == "sheet":
+                rel_id = next(
+                    (value for key, value in node.attrib.items() if _local(key) == "id"),
+                    None,
+                )
+                if rel_id in self._rels:
+                    sheets[node.get("name")] = self._rels[rel_id][1]
+        return sheets, epoch
+
+    @property
+    def shared_strings(self):
+        if self._shared_strings is None:
+            self._shared_strings = []
+            part = self._part_for_type(_REL_TYPE_SHARED_STRINGS)
+            if part and part in self._names:
+                with self._archive.open(part) as stream:
+                    for _, node in iterparse(stream):
+                        if _local(node.tag) == "si":
+                            self._shared_strings.append(_text_content(node).replace("x005F_", ""))
+                            node.clear()
+        return self._shared_strings
+
+    def _load_styles(self):
+        self._date_styles = set()
+        self._timedelta_styles = set()
+        part = self._part_for_type(_REL_TYPE_STYLES)
+        if not part or part not in self._names:
+            return
+
+        root = fromstring(self._archive.read(part))
+        custom_formats = {}
+        cell_xfs = None
+        for child in root:
+            name = _local(child.tag)
+            if name == "numFmts":
+                for num_fmt in child:
+                    custom_formats[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode")
+            elif name == "cellXfs":
+                cell_xfs = child
+        if cell_xfs is None:
+            return
+
+        for idx, xf in enumerate(cell_xfs):
+            num_fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom_formats.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+            if fmt is None:
+                continue
+            if is_date_format(fmt):
+                self._date_styles.add(idx)
+            if is_timedelta_format(fmt):
+                self._timedelta_styles.add(idx)
+
+    def conversion_signature(self):
+        """Return the workbook settings that change how cell numbers are converted."""
+        if self._date_styles is None:
+            self._load_styles()
+        return {
+            "epoch": self._epoch.isoformat(),
+            "date_styles": sorted(self._date_styles),
+            "timedelta_styles": sorted(self._timedelta_styles),
+        }
+
+    def _convert(self, node, data_type, style_id):
+        if data_type == "inlineStr":
+            for child in node:
+                if _local(child.tag) == "is":
+                    return _text_content(child)
+            return None
+
+        text = None
+        for child in node:
+            if _local(child.tag) == "v":
+                text = child.text
+                break
+        if not text:
+            return None
+
+        if data_type == "n":
+            value = _cast_number(text)
+            if style_id in self._date_styles:
+                try:
+                    return from_excel(value, self._epoch, timedelta=style_id in self._timedelta_styles)
+                except (OverflowError, ValueError):
+                    return ERROR_VALUE
+            return value
+        if data_type == "s":
+            return self.shared_strings[int(text)]
+        if data_type == "b":
+            return bool(int(text))
+        if data_type == "e":
+            return ERROR_VALUE
+        if data_type == "d":
+            return from_ISO8601(text)
+        return text
+
+    def _iter_row_nodes(self, sheet_name, min_row=1, max_row=None):
+        part = self._sheets.get(sheet_name)
+        if part is None:
+            return
+        if self._date_styles is None:
+            self._load_styles()
+
+        row_counter = 0
+        with self._archive.open(part) as stream:
+            for _, node in iterparse(stream):
+                if _local(node.tag) != "row":
+                    continue
+                row_number = int(node.get("r")) if node.get("r") else row_counter + 1
+                row_counter = row_number
+                if max_row is not None and row_number > max_row:
+                    break
+                if row_number >= min_row:
+                    yield row_number, node
+                node.clear()
+
+    def _iter_cells(self, row_node):
+        col_counter = 0
+        for cell in row_node:
+            if _local(cell.tag) != "c":
+                continue
+            reference = cell.get("r")
+            col_number = _column_index(reference) if reference else col_counter + 1
+            col_counter = col_number
+            yield col_number, cell
+
+    def _cell_value(self, cell):
+        return self._convert(cell, cell.get("t", "n"), int(cell.get("s", 0)))
+
+    def iter_rows(self, sheet_name, columns=None, min_row=1, max_row=None):
+        """Yield ``(row_number, {column_number: value})`` for every non-empty row.
+
+        When ``columns`` is given, only those 1-based column numbers are kept.
+        """
+        wanted = set(columns) if columns is not None else None
+        for row_number, node in self._iter_row_nodes(sheet_name, min_row, max_row):
+            values = {}
+            for col_number, cell in self._iter_cells(node):
+                if wanted is not None and col_number not in wanted:
+                    continue
+                value = self._cell_value(cell)
+                if value is not None:
+                    values[col_number] = value
+            if values:
+                yield row_number, values
+
+    def iter_projected_rows(self, sheet_name, columns, min_row=1, max_row=None):
+        """Yield ``(row_number, {column_number: value}, other_texts)`` keeping only ``columns``.
+
+        ``other_texts`` lists the text cells found outside ``columns``; numeric
+        cells there are skipped without being converted.
+        """
+        wanted = set(columns)
+        for row_number, node in self._iter_row_nodes(sheet_name, min_row, max_row):
+            values = {}
+            other_texts = []
+            for col_number, cell in self._iter_cells(node):
+                if col_number in wanted:
+                    value = self._cell_value(cell)
+                    if value is not None:
+                        values[col_number] = value
+                elif cell.get("t") in _TEXT_CELL_TYPES:
+                    value = self._cell_value(cell)
+                    if isinstance(value, str):
+                        other_texts.append(value)
+            if values or other_texts:
+                yield row_number, values, other_texts
+
+    def comment_parts(self, sheet_name):
+        part = self._sheets.get(sheet_name)
+        if part is None:
+            return []
+        return [
+            target
+            for rel_type, target in self._read_rels(part).values()
+            if rel_type.endswith(_REL_TYPE_COMMENTS) and target in self._names
+        ]
+
+    def comments(self, sheet_name):
+        """Return ``{(row, column): text}`` for the sheet's cell comments."""
+        comments = {}
+        for part in self.comment_parts(sheet_name):
+            with self._archive.open(part) as stream:
+                for _, node in iterparse(stream):
+                    if _local(node.tag) != "comment":
+                        continue
+                    text = ""
+                    for child in node:
+                        if _local(child.tag) == "text":
+                            text = _text_content(child)
+                    comments[coordinate_to_tuple(node.get("ref"))] = text
+                    node.clear()
+        return comments
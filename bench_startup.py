@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""앱 콜드 스타트 측정 스크립트: 첫 화면 렌더링 및 첫 강사 목록 표시까지의 시간."""
+
+import json
+import subprocess
+import sys
+
+CHILD_CODE = """
+import json
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+workbook_path = sys.argv[1]
+think_time = float(sys.argv[2])
+with open(workbook_path, "rb") as workbook_file:
+    workbook_bytes = workbook_file.read()
+
+at = AppTest.from_file("app.py", default_timeout=120)
+started = time.perf_counter()
+at.run()
+first_render = time.perf_counter() - started
+time.sleep(think_time)
+
+at.file_uploader[0].set_value((
+    "timetable.xlsx",
+    workbook_bytes,
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+))
+started = time.perf_counter()
+at.run()
+first_teacher_list = time.perf_counter() - started
+
+print(json.dumps({
+    "first_render": first_render,
+    "first_teacher_list": first_teacher_list,
+    "teachers": len(at.multiselect[-1].options) if at.multiselect else 0,
+    "exceptions": [str(exc.value) for exc in at.exception],
+}))
+"""
+
+
+def measure(workbook_path, think_time):
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE, workbook_path, str(think_time)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python bench_startup.py <시간표.xlsx> [반복 횟수] [업로드 전 대기 초]")
+        sys.exit(2)
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    think_time = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+
+    results = [measure(sys.argv[1], think_time) for _ in range(repeat)]
+    for idx, result in enumerate(results, 1):
+        print(
+            f"[{idx}] 첫 렌더링={result['first_render']:.3f}s "
+            f"첫 강사 목록={result['first_teacher_list']:.3f}s "
+            f"강사 수={result['teachers']}"
+        )
+        for message in result["exceptions"]:
+            print(f"    오류: {message}")
+    print(
+        f"최소값: 첫 렌더링={min(r['first_render'] for r in results):.3f}s "
+        f"첫 강사 목록={min(r['first_teacher_list'] for r in results):.3f}s"
+    )
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""파서 엔진(openpyxl/pandas, XML 스트리밍)과 열 선택 읽기의 결과, 속도, 메모리 비교 스크립트.
+
+파일을 지정하지 않으면 합성 시간표(메모/수강료 열, 메모, 빈 행, 합계 행, 읽지 않는 열의 ※ 비고)로
+두 엔진의 결과가 같은지, 합계 행으로 끝나는 시트의 수업이 자기 자신과 시간 중복으로 잡히지 않는지 검사합니다.
+"""
+
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, ".")
+
+from attendance_fixtures import build_timetable_bytes  # noqa: E402
+from attendance_parser import SHEET_CONFIGS, parse_language_records, parse_sheet  # noqa: E402
+from attendance_validation import validate_records  # noqa: E402
+
+
+MODES = [
+    ("openpyxl", False),
+    ("openpyxl", True),
+    ("xml", False),
+    ("xml", True),
+]
+
+
+def _mode_label(engine, project_columns):
+    return f"{engine}{'+열선택' if project_columns else ''}"
+
+
+def compare(workbook_path):
+    mismatches = 0
+    for sheet_name, header_row, day_col_idx, preferred_course_col in SHEET_CONFIGS:
+        results = {}
+        summaries = []
+        for engine, project_columns in MODES:
+            tracemalloc.start()
+            started = time.perf_counter()
+            results[engine, project_columns] = parse_sheet(
+                workbook_path,
+                sheet_name,
+                header_row,
+                day_col_idx,
+                preferred_course_col,
+                engine=engine,
+                project_columns=project_columns,
+            )
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            summaries.append(
+                f"{_mode_label(engine, project_columns)}={elapsed:.3f}s/{peak / 1024 / 1024:.1f}MB"
+            )
+
+        reference = results["openpyxl", False]
+        same = all(records == reference for records in results.values())
+        mismatches += not same
+        print(
+            f"[{sheet_name}] 수업 수={len(reference)} {' '.join(summaries)} "
+            f"{'일치' if same else '불일치'}"
+        )
+    return mismatches
+
+
+def parity_fixtures():
+    return {
+        "메모/수강료 열": build_timetable_bytes(30, seed=1, memo_columns=6),
+        "빈 행 + ※ 비고": build_timetable_bytes(30, seed=2, memo_columns=4, gap_rows=True, note_after=20),
+    }
+
+
+def check_parity():
+    failures = 0
+    for fixture_name, workbook_bytes in parity_fixtures().items():
+        for sheet_name, header_row, day_col_idx, preferred_course_col in SHEET_CONFIGS:
+            for project_columns in (False, True):
+                expected = parse_sheet(
+                    workbook_bytes,
+                    sheet_name,
+                    header_row,
+                    day_col_idx,
+                    preferred_course_col,
+                    engine="openpyxl",
+                    project_columns=project_columns,
+                )
+                actual = parse_sheet(
+                    workbook_bytes,
+                    sheet_name,
+                    header_row,
+                    day_col_idx,
+                    preferred_course_col,
+                    engine="xml",
+                    project_columns=project_columns,
+                )
+                ok = bool(expected) and actual == expected
+                failures += not ok
+                print(
+                    f"[{fixture_name}] {sheet_name} 열선택={'예' if project_columns else '아니오'} "
+                    f"수업 수={len(expected)} {'일치' if ok else '불일치'}"
+                )
+    return failures
+
+
+def check_self_conflicts():
+    failures = 0
+    for fixture_name, workbook_bytes in parity_fixtures().items():
+        for engine in ("openpyxl", "xml"):
+            records = parse_language_records(workbook_bytes, engine=engine)
+            report = validate_records(records)
+            self_conflicts = [
+                conflict
+                for key in ("teacher_conflicts", "student_conflicts")
+                for conflict in report[key]
+                if records[conflict["records"][0]] == records[conflict["records"][1]]
+            ]
+            failures += bool(self_conflicts)
+            print(
+                f"[{fixture_name}] {engine} 수업 수={len(records)} "
+                f"자기 중복={len(self_conflicts)} {'정상' if not self_conflicts else '오류'}"
+            )
+    return failures
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(1 if check_parity() + check_self_conflicts() else 0)
+    total_mismatches = sum(compare(path) for path in sys.argv[1:])
+    sys.exit(1 if total_mismatches else 0)
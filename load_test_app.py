@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""동시 접속 부하 테스트: 여러 세션이 업로드 → 강사 목록 → 출석부 생성 → 다운로드를 동시에 수행."""
+
+import argparse
+import json
+import os
+import re
+import resource
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+# SharedRuntime rebuilds AppTest's per-run runtime from Streamlit internals that
+# are not a public API; they were checked against streamlit 1.66.
+MIN_STREAMLIT_VERSION = (1, 66)
+try:
+    from streamlit.components.v2.component_manager import BidiComponentManager
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.media_file_storage import MediaFileStorageError
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.testing.v1.util import patch_config_options
+except ImportError as exc:
+    _RUNTIME_IMPORT_ERROR = exc
+else:
+    _RUNTIME_IMPORT_ERROR = None
+
+from attendance_fixtures import build_timetable_bytes
+
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+STEPS = ["first_render", "teacher_list", "generate", "download"]
+STEP_LABELS = {
+    "first_render": "첫 렌더링",
+    "teacher_list": "강사 목록",
+    "generate": "출석부 생성",
+    "download": "다운로드",
+    "flow": "전체 흐름",
+}
+
+
+def _version_tuple(version):
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2])
+
+
+def check_streamlit_support():
+    required = ".".join(map(str, MIN_STREAMLIT_VERSION))
+    if _version_tuple(streamlit.__version__) < MIN_STREAMLIT_VERSION:
+        raise RuntimeError(
+            f"load_test_app.py needs streamlit>={required} (installed {streamlit.__version__})."
+        )
+    if _RUNTIME_IMPORT_ERROR is not None:
+        raise RuntimeError(
+            f"streamlit {streamlit.__version__} no longer provides the runtime internals this "
+            f"harness relies on (checked with {required}): {_RUNTIME_IMPORT_ERROR}"
+        ) from _RUNTIME_IMPORT_ERROR
+
+
+class SharedRuntime:
+    """Serve every AppTest session from one runtime, as a single server process does.
+
+    AppTest installs a throwaway runtime around each run and clears it
+    afterwards, which breaks as soon as two sessions run at the same time.
+    Here all sessions share one media store, cache storage and component
+    registry, and downloads are fetched from that media store like a browser
+    would.
+    """
+
+    def __enter__(self):
+        check_streamlit_support()
+        self.media_storage = MemoryMediaFileStorage("/mock/media")
+        runtime = MagicMock(spec=Runtime)
+        runtime.media_file_mgr = MediaFileManager(self.media_storage)
+        runtime.dataframe_source_mgr = DataframeSourceManager()
+        runtime.cache_storage_manager = MemoryCacheStorageManager()
+        component_manager = BidiComponentManager()
+        component_manager.discover_and_register_components(start_file_watching=False)
+        runtime.bidi_component_registry = component_manager
+
+        self._patches = [
+            patch.object(Runtime, "instance", return_value=runtime),
+            patch.object(Runtime, "exists", return_value=True),
+            patch_config_options({"global.appTest": True}),
+        ]
+        for active_patch in self._patches:
+            active_patch.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        for active_patch in reversed(self._patches):
+            active_patch.__exit__(*exc_info)
+
+    def fetch(self, url):
+        try:
+            return self.media_storage.get_file(os.path.basename(url)).content
+        except MediaFileStorageError:
+            return None
+
+
+class RssSampler:
+    """Track the peak resident set size of this process while the load test runs."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.baseline = self.peak = self._current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    @staticmethod
+    def _current_rss():
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self._current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._current_rss())
+
+
+def _timed(action):
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def run_session(session_idx, workbook_bytes, runtime, think_time=0.0, timeout=300):
+    result = {"session": session_idx, "timings": {}, "teachers": 0, "download_bytes": 0, "errors": []}
+    timings = result["timings"]
+    flow_started = time.perf_counter()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    timings["first_render"] = _timed(at.run)
+    time.sleep(think_time)
+
+    at.file_uploader[0].set_value((f"timetable_{session_idx}.xlsx", workbook_bytes, XLSX_MIME))
+    timings["teacher_list"] = _timed(at.run)
+    result["teachers"] = len(at.multiselect[-1].options) if at.multiselect else 0
+    time.sleep(think_time)
+
+    generate_buttons = [button for button in at.button if button.label == "출석부 생성"]
+    if not generate_buttons:
+        result["errors"].append("출석부 생성 버튼을 찾지 못했습니다.")
+        result["errors"].extend(str(exc.value) for exc in at.exception)
+        return result
+    timings["generate"] = _timed(lambda: generate_buttons[0].click().run())
+
+    download_buttons = at.get("download_button")
+    if not download_buttons:
+        result["errors"].append("다운로드 버튼을 찾지 못했습니다.")
+        result["errors"].extend(str(exc.value) for exc in at.exception)
+        return result
+
+    def download():
+        data = runtime.fetch(download_buttons[0].proto.url)
+        if not data:
+            raise RuntimeError("다운로드 파일을 찾지 못했습니다.")
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            archive.testzip()
+        result["download_bytes"] = len(data)
+
+    try:
+        timings["download"] = _timed(download)
+    except (RuntimeError, zipfile.BadZipFile) as exc:
+        result["errors"].append(str(exc))
+
+    timings["flow"] = time.perf_counter() - flow_started
+    result["errors"].extend(str(exc.value) for exc in at.exception)
+    return result
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(results, wall_time, rss):
+    completed = [result for result in results if not result["errors"] and "flow" in result["timings"]]
+    steps = {}
+    for step in [*STEPS, "flow"]:
+        values = [result["timings"][step] for result in results if step in result["timings"]]
+        steps[step] = {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values, default=None),
+        }
+    return {
+        "sessions": len(results),
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "wall_time": wall_time,
+        "throughput_per_min": len(completed) / wall_time * 60 if wall_time else 0.0,
+        "rss_baseline_mb": rss.baseline / 1024 / 1024,
+        "rss_peak_mb": rss.peak / 1024 / 1024,
+        "steps": steps,
+        "errors": [
+            f"[세션 {result['session']}] {message}"
+            for result in results
+            for message in result["errors"]
+        ],
+    }
+
+
+def run_load_test(sessions, rounds=1, classes_per_sheet=40, same_workbook=False, think_time=0.0, stagger=0.0):
+    workbooks = [
+        build_timetable_bytes(classes_per_sheet, seed=0 if same_workbook else idx)
+        for idx in range(sessions)
+    ]
+
+    results = []
+    with SharedRuntime() as runtime, RssSampler() as rss:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            futures = []
+            for round_idx in range(rounds):
+                for idx in range(sessions):
+                    session_idx = round_idx * sessions + idx
+                    futures.append((session_idx, executor.submit(
+                        run_session,
+                        session_idx,
+                        workbooks[idx],
+                        runtime,
+                        think_time,
+                    )))
+                    if stagger:
+                        time.sleep(stagger)
+            for session_idx, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    results.append({"session": session_idx, "timings": {}, "errors": [repr(exc)]})
+        wall_time = time.perf_counter() - started
+    return summarize(results, wall_time, rss)
+
+
+def print_summary(summary):
+    print(
+        f"세션 {summary['sessions']}개 · 성공 {summary['completed']} · 실패 {summary['failed']} · "
+        f"총 {summary['wall_time']:.2f}s · 처리량 {summary['throughput_per_min']:.1f}건/분"
+    )
+    print(f"RSS 시작={summary['rss_baseline_mb']:.1f}MB 최대={summary['rss_peak_mb']:.1f}MB")
+    for step, stats in summary["steps"].items():
+        if not stats["count"]:
+            continue
+        print(
+            f"  {STEP_LABELS[step]}: p50={stats['p50']:.3f}s p90={stats['p90']:.3f}s "
+            f"p95={stats['p95']:.3f}s p99={stats['p99']:.3f}s max={stats['max']:.3f}s"
+        )
+    for message in summary["errors"]:
+        print(f"  오류: {message}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="출석부 앱 동시 접속 부하 테스트")
+    parser.add_argument("--sessions", type=int, default=4, help="동시 세션 수")
+    parser.add_argument("--rounds", type=int, default=1, help="세션당 반복 횟수")
+    parser.add_argument("--classes", type=int, default=40, help="시트당 합성 수업 수")
+    parser.add_argument("--same-workbook", action="store_true", help="모든 세션이 같은 파일을 업로드 (캐시 효과 측정)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="단계 사이 대기 초")
+    parser.add_argument("--stagger", type=float, default=0.0, help="세션 시작 간격 초")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    try:
+        check_streamlit_support()
+    except RuntimeError as exc:
+        print(f"오류: {exc}")
+        return 2
+
+    summary = run_load_test(
+        args.sessions,
+        rounds=args.rounds,
+        classes_per_sheet=args.classes,
+        same_workbook=args.same_workbook,
+        think_time=args.think_time,
+        stagger=args.stagger,
+    )
+    print_summary(summary)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(summary, json_file, ensure_ascii=False, indent=2)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())